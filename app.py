@@ -12,7 +12,7 @@ from werkzeug.utils import secure_filename
 
 from dataclasses import asdict
 
-from core_logic.ocr_engine import process_bank_statement
+from core_logic.ocr_engine import process_bank_statement, process_bank_statements
 from core_logic.scrubber import scrub_transactions, detect_inter_account_transfers, analyze_concentration
 from core_logic.risk_engine import generate_risk_profile, analyze_risk
 from core_logic.lender_matcher import find_matching_lenders
@@ -258,8 +258,7 @@ def run_combined_pipeline(pdf_paths):
         ocr_total_withdrawals = 0
         
         per_file_transactions = {}
-        for pdf_path in pdf_paths:
-            ocr_data = process_bank_statement(pdf_path)
+        for ocr_data in process_bank_statements(pdf_paths):
             if ocr_data and ocr_data.get('success'):
                 transactions = ocr_data.get('transactions', [])
                 bank_fmt = ocr_data.get('bank_format', 'unknown')
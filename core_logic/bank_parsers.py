@@ -27,8 +27,9 @@ Each parser returns standardized format:
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime
+from datetime import date, datetime
 from dateutil import parser as date_parser
 
 
@@ -97,10 +98,126 @@ BANK_DETECTION_PATTERNS = {
 }
 
 
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+# Built once at import; the parsers run these on every line of a statement.
+
+_BANK_DETECTION_REGEXES = {
+    bank: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for bank, patterns in BANK_DETECTION_PATTERNS.items()
+}
+_YEAR_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(\d{4})\s+through\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(\d{4})',
+    r'(?:for|period|from)\s+\w+\s+\d{1,2},?\s+(\d{4})',
+    r'(\d{4})\s+to\s+\w+\s+\d{1,2}',
+    r'Statement\s+Period[:\s]+.*?(\d{4})',
+    r'(\d{1,2}/\d{1,2}/(\d{4}))',
+)]
+
+# Shared line tests
+_LEADING_MMDD_RE = re.compile(r'^\d{2}/\d{2}')
+_CENTS_AMOUNT_RE = re.compile(r'[\d,]+\.\d{2}')
+_LEADING_AMOUNT_RE = re.compile(r'[\$\-\(]?[\d,]+\.\d{2}')
+
+_CHASE_MARKER_BEFORE_DATE_RE = re.compile(r'\*(?:start|end)\*.*?(?=\d{2}/\d{2}\s)')
+_CHASE_MARKER_LINE_RE = re.compile(r'\*(?:start|end)\*[^\n]*')
+_CHASE_SKIP_RE = re.compile(
+    r'^(Total |DATE$|CHECK NO|If you see|not the original|\*|•|Page |\d+ items|Ledger |Number |Opening |Ending |Summary|Commercial |Account Number|Please examine)',
+    re.IGNORECASE
+)
+# Section headers and ACH continuation fields, matched against upper-cased lines
+_CHASE_CREDIT_HEADER_RE = re.compile('|'.join(map(re.escape, [
+    'DEPOSITS AND ADDITIONS', 'DEPOSITS AND CREDITS',
+])))
+_CHASE_DEBIT_HEADER_RE = re.compile('|'.join(map(re.escape, [
+    'CHECKS PAID', 'ELECTRONIC WITHDRAWALS', 'ATM & DEBIT CARD WITHDRAWALS',
+    'OTHER WITHDRAWALS', 'WITHDRAWALS AND DEBITS', 'FEES', 'SERVICE CHARGES',
+])))
+_CHASE_STOP_HEADER_RE = re.compile('|'.join(map(re.escape, [
+    'DAILY ENDING BALANCE', 'DAILY LEDGER BALANCE', 'DAILY BALANCE',
+    'SERVICE CHARGE SUMMARY', 'TRANSACTION DETAIL', 'OVERDRAFT PROTECTION',
+])))
+_CHASE_CONTINUATION_RE = re.compile('|'.join(map(re.escape, [
+    'ENTRY DESCR:', 'IND ID:', 'IND NAME:', 'TRN:', 'TRACE#',
+    'IMAD:', 'YOUR REF:', 'ORIG CO', 'ORIG ID:', 'EED:',
+    'SEC:', 'DIRECT DEPOSIT', 'CO ENTRY',
+])))
+_CHASE_SUMMARY_RE = re.compile(r'\d+\s+\$[\d,]+\.\d{2}')
+_CHASE_LINE_RE = re.compile(r'^(\d{2}/\d{2})\s+(.+?)\s+\$?([\d,]+\.\d{2})\s*$')
+_CHASE_CHECK_RE = re.compile(r'^(\d+)\s*\*?\^?\s*(\d{2}/\d{2})\s+\$?([\d,]+\.\d{2})\s*$')
+
+_BOFA_CREDIT_SECTION_RE = re.compile('DEPOSITS AND OTHER CREDITS|DEPOSITS')
+_BOFA_DEBIT_SECTION_RE = re.compile('WITHDRAWALS AND OTHER DEBITS|WITHDRAWALS|CHECKS|SERVICE FEES')
+_BOFA_DETAIL_RE = re.compile('DES:|ID:|INDN:|CO ID:|CCD|PPD|WEB')
+_BOFA_LINE_RE = re.compile(r'^(\d{2}/\d{2}/\d{2})\s+(.+?)\s+([\-]?[\d,]+\.\d{2})\s*$')
+_BOFA_CARD_RE = re.compile(r'^(\d{2}/\d{2}/\d{2})\s+(CHECKCARD|PURCHASE)\s+(\d{4})\s+(.+?)\s+([\-]?[\d,]+\.\d{2})\s*$')
+_BOFA_CHECK_RE = re.compile(r'(\d{2}/\d{2}/\d{2})\s+(\d+)\s+([\-]?[\d,]+\.\d{2})')
+
+_WELLS_MTD_HEADER_RE = re.compile(r'Deposits/Credits.*Withdrawals/Debits', re.IGNORECASE)
+_WELLS_FORMAL_LINE_RE = re.compile(r'^\$?([\d,]+\.\d{2})\s*(<)?\s+(.+)$')
+_WELLS_DESC_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}(?:/\d{2,4})?)')
+_WELLS_MTD_LINE_RE = re.compile(r'^(\d{1,2}/\d{1,2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s*$')
+
+_CITI_LINE_RE = re.compile(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$')
+_CITI_CHECK_RE = re.compile(r'^(\d{2}/\d{2})\s+CHECK\s+NO:\s*(\d+)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})')
+
+_US_BANK_LINE_RE = re.compile(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+\$?\s*([\d,]+\.\d{2})([\-]?)\s*$')
+
+_WEBSTER_FULL_DATE_RE = re.compile(r'\d{2}/\d{2}/\d{4}')
+_WEBSTER_DEBIT_RE = re.compile(r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+\-?\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$')
+_WEBSTER_CREDIT_RE = re.compile(r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$')
+_WEBSTER_MTD_LINE_RE = re.compile(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+([\-\+]?\$?[\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$')
+
+_GENERIC_TABLE_DATE_RE = re.compile(r'\d{1,2}[/\-]\d{1,2}')
+# Transaction line layouts, tried in order
+_GENERIC_LINE_REGEXES = [re.compile(pattern) for pattern in (
+    # MM/DD/YYYY Description Amount
+    r'^(\d{1,2}/\d{1,2}/\d{2,4})\s+(.+?)\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s*$',
+    # MM/DD Description Amount
+    r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s*$',
+    # Date Amount Description
+    r'^(\d{1,2}/\d{1,2}/?\d{0,4})\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s+(.+)$',
+    # MMM DD Description Amount
+    r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s*$',
+)]
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# (strptime format, needs year) in order of preference
+_DATE_FORMATS = (
+    ("%m/%d/%Y", False),
+    ("%m/%d/%y", False),
+    ("%m/%d", True),  # needs year
+    ("%m-%d-%Y", False),
+    ("%m-%d-%y", False),
+    ("%b %d", True),  # needs year (e.g., "Feb 1")
+    ("%b %d, %Y", False),
+    ("%B %d", True),
+    ("%B %d, %Y", False),
+    ("%Y-%m-%d", False),
+)
+# A format can only match strings containing its separators, so each date
+# string only tries the formats that share its '/' or '-'
+_SLASH_DATE_FORMATS = tuple(f for f in _DATE_FORMATS if '/' in f[0])
+_DASH_DATE_FORMATS = tuple(f for f in _DATE_FORMATS if '-' in f[0])
+_NAMED_DATE_FORMATS = tuple(f for f in _DATE_FORMATS if '/' not in f[0] and '-' not in f[0])
+
+# Month names and abbreviations as dateutil reads them, for the
+# month-day-year strings strptime misses (no comma, trailing dot, "Sept")
+_MONTH_NUMBERS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12,
+}
+# Four-digit years only: dateutil reads "0078" as a two-digit year
+_MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]{3,9})\.?\s+([0-9]{1,2}),?\s+([1-9][0-9]{3})')
+
+
 def parse_date_safe(date_str: str, year_hint: int = None) -> Optional[str]:
     """
     Parse various date formats into YYYY-MM-DD.
@@ -110,26 +227,30 @@ def parse_date_safe(date_str: str, year_hint: int = None) -> Optional[str]:
     - MM/DD (adds year)
     - MMM DD (adds year)
     - MM-DD-YYYY
+
+    Statements repeat the same date strings many times, so results are
+    memoized (see _parse_date_cached).
     """
     if not date_str or not date_str.strip():
         return None
     
-    date_str = date_str.strip()
-    current_year = year_hint or datetime.now().year
-    
-    # Direct format attempts
-    formats = [
-        ("%m/%d/%Y", False),
-        ("%m/%d/%y", False),
-        ("%m/%d", True),  # needs year
-        ("%m-%d-%Y", False),
-        ("%m-%d-%y", False),
-        ("%b %d", True),  # needs year (e.g., "Feb 1")
-        ("%b %d, %Y", False),
-        ("%B %d", True),
-        ("%B %d, %Y", False),
-        ("%Y-%m-%d", False),
-    ]
+    today = date.today()
+    return _parse_date_cached(date_str.strip(), year_hint or today.year, today)
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str, current_year: int, today: date) -> Optional[str]:
+    """
+    parse_date_safe() for a stripped, non-empty string. today is only part
+    of the cache key: the fuzzy fallback fills missing fields from it.
+    """
+    # Direct format attempts, limited to those with the string's separator
+    if '/' in date_str:
+        formats = _SLASH_DATE_FORMATS if '-' not in date_str else ()
+    elif '-' in date_str:
+        formats = _DASH_DATE_FORMATS
+    else:
+        formats = _NAMED_DATE_FORMATS
     
     for fmt, needs_year in formats:
         try:
@@ -142,6 +263,16 @@ def parse_date_safe(date_str: str, year_hint: int = None) -> Optional[str]:
         except ValueError:
             continue
     
+    # "Nov. 5 2025" style strings are common and cheap to read directly
+    match = _MONTH_DAY_YEAR_RE.fullmatch(date_str)
+    if match:
+        month = _MONTH_NUMBERS.get(match.group(1).lower())
+        if month:
+            try:
+                return datetime(int(match.group(3)), month, int(match.group(2))).strftime("%Y-%m-%d")
+            except ValueError:
+                pass
+    
     # Fuzzy parse as last resort
     try:
         dt = date_parser.parse(date_str, fuzzy=True)
@@ -199,9 +330,9 @@ def detect_bank(text: str) -> str:
     """
     text_upper = text.upper()
     
-    for bank, patterns in BANK_DETECTION_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+    for bank, regexes in _BANK_DETECTION_REGEXES.items():
+        for regex in regexes:
+            if regex.search(text):
                 return bank
     
     return 'unknown'
@@ -209,16 +340,8 @@ def detect_bank(text: str) -> str:
 
 def extract_year_from_text(text: str) -> int:
     """Extract statement year from text for date parsing."""
-    patterns = [
-        r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(\d{4})\s+through\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(\d{4})',
-        r'(?:for|period|from)\s+\w+\s+\d{1,2},?\s+(\d{4})',
-        r'(\d{4})\s+to\s+\w+\s+\d{1,2}',
-        r'Statement\s+Period[:\s]+.*?(\d{4})',
-        r'(\d{1,2}/\d{1,2}/(\d{4}))',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for regex in _YEAR_REGEXES:
+        match = regex.search(text)
         if match:
             groups = match.groups()
             if len(groups) == 2 and all(g and g.isdigit() and 2000 <= int(g) <= 2100 for g in groups):
@@ -279,24 +402,13 @@ def extract_transactions_chase(text: str, tables: List[List] = None) -> List[Dic
     transactions = []
     year = extract_year_from_text(text)
     
-    cleaned_text = re.sub(r'\*(?:start|end)\*.*?(?=\d{2}/\d{2}\s)', '', text)
-    cleaned_text = re.sub(r'\*(?:start|end)\*[^\n]*', '', cleaned_text)
+    cleaned_text = _CHASE_MARKER_BEFORE_DATE_RE.sub('', text)
+    cleaned_text = _CHASE_MARKER_LINE_RE.sub('', cleaned_text)
     lines = cleaned_text.split('\n')
     
     current_section = None
     section_is_credit = False
     
-    credit_headers = ['DEPOSITS AND ADDITIONS', 'DEPOSITS AND CREDITS']
-    debit_headers = ['CHECKS PAID', 'ELECTRONIC WITHDRAWALS', 'ATM & DEBIT CARD WITHDRAWALS',
-                     'OTHER WITHDRAWALS', 'WITHDRAWALS AND DEBITS', 'FEES', 'SERVICE CHARGES']
-    stop_headers = ['DAILY ENDING BALANCE', 'DAILY LEDGER BALANCE', 'DAILY BALANCE',
-                    'SERVICE CHARGE SUMMARY', 'TRANSACTION DETAIL', 'OVERDRAFT PROTECTION']
-    
-    skip_patterns = re.compile(
-        r'^(Total |DATE$|CHECK NO|If you see|not the original|\*|•|Page |\d+ items|Ledger |Number |Opening |Ending |Summary|Commercial |Account Number|Please examine)',
-        re.IGNORECASE
-    )
-    
     for i, line in enumerate(lines):
         line = line.strip()
         if not line:
@@ -304,41 +416,30 @@ def extract_transactions_chase(text: str, tables: List[List] = None) -> List[Dic
         
         line_upper = line.upper()
         
-        is_stop = False
-        for header in stop_headers:
-            if header in line_upper:
-                current_section = None
-                is_stop = True
-                break
-        if is_stop:
+        if _CHASE_STOP_HEADER_RE.search(line_upper):
+            current_section = None
             continue
         
-        matched_section = False
-        is_summary_line = bool(re.search(r'\d+\s+\$[\d,]+\.\d{2}', line))
-        for header in debit_headers:
-            if header in line_upper and not line_upper.startswith('TOTAL') and not is_summary_line:
-                current_section = 'debit'
-                section_is_credit = False
-                matched_section = True
-                break
-        if not matched_section:
-            for header in credit_headers:
-                if header in line_upper and not line_upper.startswith('TOTAL') and not is_summary_line:
-                    current_section = 'credit'
-                    section_is_credit = True
-                    matched_section = True
-                    break
-        
-        if matched_section:
+        if _CHASE_DEBIT_HEADER_RE.search(line_upper):
+            header_section = 'debit'
+        elif _CHASE_CREDIT_HEADER_RE.search(line_upper):
+            header_section = 'credit'
+        else:
+            header_section = None
+        # Totals and "N items $X" summary lines mention headers too
+        if (header_section and not line_upper.startswith('TOTAL')
+                and not _CHASE_SUMMARY_RE.search(line)):
+            current_section = header_section
+            section_is_credit = header_section == 'credit'
             continue
         
         if current_section is None:
             continue
         
-        if skip_patterns.match(line):
+        if _CHASE_SKIP_RE.match(line):
             continue
         
-        match = re.match(r'^(\d{2}/\d{2})\s+(.+?)\s+\$?([\d,]+\.\d{2})\s*$', line)
+        match = _CHASE_LINE_RE.match(line)
         
         if match:
             date_str = match.group(1)
@@ -346,15 +447,13 @@ def extract_transactions_chase(text: str, tables: List[List] = None) -> List[Dic
             amount = parse_amount_safe(match.group(3))
             
             if amount is not None:
-                parsed_date = parse_date_safe(f"{date_str}/{year}")
-                
                 if not section_is_credit:
                     amount = -abs(amount)
                 else:
                     amount = abs(amount)
                 
                 transactions.append({
-                    'date': parsed_date or date_str,
+                    'date': date_str,
                     'description': description[:300],
                     'amount': amount,
                     'debit': abs(amount) if amount < 0 else 0,
@@ -365,18 +464,17 @@ def extract_transactions_chase(text: str, tables: List[List] = None) -> List[Dic
                 })
             continue
         
-        check_match = re.match(r'^(\d+)\s*\*?\^?\s*(\d{2}/\d{2})\s+\$?([\d,]+\.\d{2})\s*$', line)
+        check_match = _CHASE_CHECK_RE.match(line)
         if check_match and current_section == 'debit':
             check_num = check_match.group(1)
             date_str = check_match.group(2)
             amount = parse_amount_safe(check_match.group(3))
             
             if amount is not None:
-                parsed_date = parse_date_safe(f"{date_str}/{year}")
                 amount = -abs(amount)
                 
                 transactions.append({
-                    'date': parsed_date or date_str,
+                    'date': date_str,
                     'description': f"CHECK #{check_num}",
                     'amount': amount,
                     'debit': abs(amount),
@@ -387,18 +485,20 @@ def extract_transactions_chase(text: str, tables: List[List] = None) -> List[Dic
                 })
             continue
         
-        if current_section and not re.match(r'^\d{2}/\d{2}', line):
+        if current_section and not _LEADING_MMDD_RE.match(line):
             if transactions and len(line) > 5:
-                jpm_continuation = any(kw in line.upper() for kw in [
-                    'ENTRY DESCR:', 'IND ID:', 'IND NAME:', 'TRN:', 'TRACE#',
-                    'IMAD:', 'YOUR REF:', 'ORIG CO', 'ORIG ID:', 'EED:',
-                    'SEC:', 'DIRECT DEPOSIT', 'CO ENTRY'
-                ])
-                if jpm_continuation or not re.search(r'[\d,]+\.\d{2}', line):
+                jpm_continuation = _CHASE_CONTINUATION_RE.search(line_upper)
+                if jpm_continuation or not _CENTS_AMOUNT_RE.search(line):
                     prev_desc = transactions[-1]['description']
                     if len(prev_desc) < 250:
                         transactions[-1]['description'] = f"{prev_desc} {line}"[:300]
     
+    # A statement repeats the same few dozen MM/DD dates across hundreds of
+    # rows, so resolve each distinct date once after the scan.
+    parsed_dates = {d: parse_date_safe(f"{d}/{year}") for d in {t['date'] for t in transactions}}
+    for txn in transactions:
+        txn['date'] = parsed_dates[txn['date']] or txn['date']
+    
     return transactions
 
 
@@ -425,9 +525,6 @@ def extract_transactions_bofa(text: str, tables: List[List] = None) -> List[Dict
     current_section = None
     section_is_credit = False
     
-    credit_sections = ['DEPOSITS AND OTHER CREDITS', 'DEPOSITS']
-    debit_sections = ['WITHDRAWALS AND OTHER DEBITS', 'WITHDRAWALS', 'CHECKS', 'SERVICE FEES']
-    
     i = 0
     while i < len(lines):
         line = lines[i].strip()
@@ -437,18 +534,16 @@ def extract_transactions_bofa(text: str, tables: List[List] = None) -> List[Dict
         
         # Detect section headers
         line_upper = line.upper()
-        for section in credit_sections:
-            if section in line_upper:
-                current_section = 'credit'
-                section_is_credit = True
-        for section in debit_sections:
-            if section in line_upper:
-                current_section = 'debit'
-                section_is_credit = False
+        if _BOFA_CREDIT_SECTION_RE.search(line_upper):
+            current_section = 'credit'
+            section_is_credit = True
+        if _BOFA_DEBIT_SECTION_RE.search(line_upper):
+            current_section = 'debit'
+            section_is_credit = False
         
         # BOA format: MM/DD/YY Description Amount
         # Amount may have - prefix for debits
-        match = re.match(r'^(\d{2}/\d{2}/\d{2})\s+(.+?)\s+([\-]?[\d,]+\.\d{2})\s*$', line)
+        match = _BOFA_LINE_RE.match(line)
         
         if match:
             date_str = match.group(1)
@@ -462,9 +557,9 @@ def extract_transactions_bofa(text: str, tables: List[List] = None) -> List[Dict
             while j < len(lines) and j < i + 4:
                 next_line = lines[j].strip()
                 # Continuation line doesn't start with date
-                if next_line and not re.match(r'^\d{2}/\d{2}', next_line):
+                if next_line and not _LEADING_MMDD_RE.match(next_line):
                     # Check if it looks like ACH detail
-                    if any(kw in next_line.upper() for kw in ['DES:', 'ID:', 'INDN:', 'CO ID:', 'CCD', 'PPD', 'WEB']):
+                    if _BOFA_DETAIL_RE.search(next_line.upper()):
                         full_description = f"{full_description} {next_line}"
                         j += 1
                     else:
@@ -491,7 +586,7 @@ def extract_transactions_bofa(text: str, tables: List[List] = None) -> List[Dict
                 })
         
         # Also check for CHECKCARD/PURCHASE format (card transactions)
-        card_match = re.match(r'^(\d{2}/\d{2}/\d{2})\s+(CHECKCARD|PURCHASE)\s+(\d{4})\s+(.+?)\s+([\-]?[\d,]+\.\d{2})\s*$', line)
+        card_match = _BOFA_CARD_RE.match(line)
         if card_match:
             date_str = card_match.group(1)
             txn_type = card_match.group(2)
@@ -517,7 +612,6 @@ def extract_transactions_bofa(text: str, tables: List[List] = None) -> List[Dict
         i += 1
     
     # Handle Checks section separately (Date | Check # | Amount format)
-    check_pattern = re.compile(r'(\d{2}/\d{2}/\d{2})\s+(\d+)\s+([\-]?[\d,]+\.\d{2})')
     in_checks_section = False
     
     for line in lines:
@@ -525,7 +619,7 @@ def extract_transactions_bofa(text: str, tables: List[List] = None) -> List[Dict
             in_checks_section = True
             continue
         if in_checks_section:
-            check_match = check_pattern.search(line)
+            check_match = _BOFA_CHECK_RE.search(line)
             if check_match:
                 date_str = check_match.group(1)
                 check_num = check_match.group(2)
@@ -566,7 +660,7 @@ def extract_transactions_wells_fargo(text: str, tables: List[List] = None) -> Li
     - Otherwise → Formal statement format
     """
     # Detect format
-    is_mtd_format = bool(re.search(r'Deposits/Credits.*Withdrawals/Debits', text, re.IGNORECASE))
+    is_mtd_format = bool(_WELLS_MTD_HEADER_RE.search(text))
     
     if is_mtd_format:
         return _parse_wells_fargo_mtd(text)
@@ -602,7 +696,7 @@ def _parse_wells_fargo_formal(text: str) -> List[Dict]:
         
         # Wells Fargo formal: $Amount < Description (< indicates ACH debit)
         # Or: $Amount Description
-        match = re.match(r'^\$?([\d,]+\.\d{2})\s*(<)?\s+(.+)$', line)
+        match = _WELLS_FORMAL_LINE_RE.match(line)
         
         if match:
             amount = parse_amount_safe(match.group(1))
@@ -610,7 +704,7 @@ def _parse_wells_fargo_formal(text: str) -> List[Dict]:
             description = match.group(3).strip()
             
             # Extract date from description if present
-            date_match = re.search(r'(\d{1,2}/\d{1,2}(?:/\d{2,4})?)', description)
+            date_match = _WELLS_DESC_DATE_RE.search(description)
             date_str = date_match.group(1) if date_match else None
             
             if amount is not None:
@@ -655,7 +749,7 @@ def _parse_wells_fargo_mtd(text: str) -> List[Dict]:
         # One of the amount columns will be empty
         
         # Pattern for line with deposit (credit)
-        credit_match = re.match(r'^(\d{1,2}/\d{1,2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s*$', line)
+        credit_match = _WELLS_MTD_LINE_RE.match(line)
         
         # Pattern for line with withdrawal (debit) - usually has empty deposit column
         # This is harder to detect, so we also look for description patterns
@@ -727,9 +821,7 @@ def extract_transactions_citibank(text: str, tables: List[List] = None) -> List[
         # Pattern: MM/DD Description Debit Credit Balance
         
         # Debit transaction (has amount in debit column)
-        debit_match = re.match(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$', line)
-        # Credit transaction (has amount in credit column, then balance)
-        credit_match = re.match(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s*$', line)
+        debit_match = _CITI_LINE_RE.match(line)
         
         # Try to parse as debit first (has 2 amounts: debit and balance)
         if debit_match:
@@ -741,7 +833,7 @@ def extract_transactions_citibank(text: str, tables: List[List] = None) -> List[
             # Check next line for description continuation
             if i + 1 < len(lines):
                 next_line = lines[i + 1].strip()
-                if next_line and not re.match(r'^\d{2}/\d{2}', next_line):
+                if next_line and not _LEADING_MMDD_RE.match(next_line):
                     description = f"{description} {next_line}"
             
             if amount1 is not None:
@@ -765,7 +857,7 @@ def extract_transactions_citibank(text: str, tables: List[List] = None) -> List[
                 })
         
         # Also try simpler pattern for CHECK NO: lines
-        check_match = re.match(r'^(\d{2}/\d{2})\s+CHECK\s+NO:\s*(\d+)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})', line)
+        check_match = _CITI_CHECK_RE.match(line)
         if check_match:
             date_str = check_match.group(1)
             check_num = check_match.group(2)
@@ -831,7 +923,7 @@ def extract_transactions_us_bank(text: str, tables: List[List] = None) -> List[D
         
         # US Bank format: MMM DD Description $ Amount
         # Amount may have - suffix for debits
-        match = re.match(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+\$?\s*([\d,]+\.\d{2})([\-]?)\s*$', line)
+        match = _US_BANK_LINE_RE.match(line)
         
         if match:
             date_str = match.group(1)
@@ -879,7 +971,7 @@ def extract_transactions_webster(text: str, tables: List[List] = None) -> List[D
     2. Online/MTD: MMM DD with +/- single amount column
     """
     # Detect format by date pattern
-    has_full_date = bool(re.search(r'\d{2}/\d{2}/\d{4}', text))
+    has_full_date = bool(_WEBSTER_FULL_DATE_RE.search(text))
     
     if has_full_date:
         return _parse_webster_formal(text)
@@ -904,14 +996,10 @@ def _parse_webster_formal(text: str) -> List[Dict]:
         # Webster formal: MM/DD/YYYY | Description | Debits | Credits | Balance
         # Debits have -$ prefix
         
-        # Pattern with debit
-        debit_match = re.match(r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+\-?\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$', line)
-        
-        # Pattern with credit (debit column empty)
-        credit_match = re.match(r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+\$?([\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$', line)
+        # Pattern with debit, then with credit (debit column empty)
+        match = _WEBSTER_DEBIT_RE.match(line) or _WEBSTER_CREDIT_RE.match(line)
         
-        if debit_match or credit_match:
-            match = debit_match or credit_match
+        if match:
             date_str = match.group(1)
             description = match.group(2).strip()
             amount1 = parse_amount_safe(match.group(3))
@@ -956,7 +1044,7 @@ def _parse_webster_mtd(text: str) -> List[Dict]:
             continue
         
         # Webster MTD: MMM DD | Description | Amount | Balance
-        match = re.match(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+([\-\+]?\$?[\d,]+\.\d{2})\s+\$?([\d,]+\.\d{2})\s*$', line)
+        match = _WEBSTER_MTD_LINE_RE.match(line)
         
         if match:
             date_str = match.group(1)
@@ -1013,10 +1101,10 @@ def extract_transactions_generic_improved(text: str, tables: List[List] = None)
                 if cell:
                     cell_str = str(cell).strip()
                     # Check if date
-                    if re.match(r'\d{1,2}[/\-]\d{1,2}', cell_str):
+                    if _GENERIC_TABLE_DATE_RE.match(cell_str):
                         date_str = cell_str
                     # Check if amount
-                    elif re.match(r'[\$\-\(]?[\d,]+\.\d{2}', cell_str):
+                    elif _LEADING_AMOUNT_RE.match(cell_str):
                         amount = parse_amount_safe(cell_str)
                     # Otherwise description
                     elif len(cell_str) > 3:
@@ -1026,7 +1114,7 @@ def extract_transactions_generic_improved(text: str, tables: List[List] = None)
             for cell in row[3:]:
                 if cell and amount is None:
                     cell_str = str(cell).strip()
-                    if re.match(r'[\$\-\(]?[\d,]+\.\d{2}', cell_str):
+                    if _LEADING_AMOUNT_RE.match(cell_str):
                         amount = parse_amount_safe(cell_str)
             
             if date_str and amount is not None:
@@ -1054,25 +1142,13 @@ def extract_transactions_generic_improved(text: str, tables: List[List] = None)
     if not transactions:
         lines = text.split('\n')
         
-        # Multiple transaction patterns to try
-        patterns = [
-            # MM/DD/YYYY Description Amount
-            r'^(\d{1,2}/\d{1,2}/\d{2,4})\s+(.+?)\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s*$',
-            # MM/DD Description Amount
-            r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s*$',
-            # Date Amount Description
-            r'^(\d{1,2}/\d{1,2}/?\d{0,4})\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s+(.+)$',
-            # MMM DD Description Amount
-            r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+([\-\$\(]?[\d,]+\.\d{2}[\)\-]?)\s*$',
-        ]
-        
         for line in lines:
             line = line.strip()
             if not line or len(line) < 10:
                 continue
             
-            for pattern in patterns:
-                match = re.match(pattern, line)
+            for regex in _GENERIC_LINE_REGEXES:
+                match = regex.match(line)
                 if match:
                     groups = match.groups()
                     
@@ -1080,7 +1156,7 @@ def extract_transactions_generic_improved(text: str, tables: List[List] = None)
                     date_str = groups[0]
                     if len(groups) == 3:
                         # Check if group 2 is amount or description
-                        if re.match(r'[\-\$\(]?[\d,]+\.\d{2}', groups[1]):
+                        if _LEADING_AMOUNT_RE.match(groups[1]):
                             amount = parse_amount_safe(groups[1])
                             description = groups[2]
                         else:
@@ -7,12 +7,174 @@ Checks deal profiles against lender eligibility criteria with:
   4. Lender appetite weighting
 """
 
-import csv
+import heapq
+import multiprocessing
 import os
-from typing import List, Dict
-
+import re
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter, itemgetter
+from typing import List, Dict, FrozenSet, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Lender tables at least this long have their per-lender pass split across
+# worker processes in match_lenders_batch()
+_PARALLEL_MIN_LENDERS = 10_000
+
+# Used by find_matching_lenders() when no CSV path is given
+_DEFAULT_LENDER_CSV = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'input_config', 'lender_template.csv'
+)
+
+
+@lru_cache(maxsize=None)
+def _pool_context():
+    """
+    Multiprocessing context for the lender pool, resolved on first use.
 
-def match_lenders(deal_data: dict, lenders_csv_path: str) -> dict:
+    Workers come from a fork server rather than a fork() of this process,
+    which is unsafe once the host (e.g. the Flask app) has started threads;
+    the server preloads this module so each worker starts with numpy/pandas
+    already imported. Platforms without a fork server use "spawn".
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+# ── Lender records ──────────────────────────────────────────────────
+
+@dataclass(slots=True, frozen=True)
+class Lender:
+    """One parsed row of the 73-column lender template."""
+    # ── Basic Info ──
+    lender_name: str
+    display_name: str
+    submission_email: str
+    cc_email: str
+    website: str
+    rating: float
+    rep_contact_name: str
+    rep_contact_email: str
+    rep_phone: str
+
+    # ── Product Info ──
+    product_types: List[str]
+    positions_accepted: List[str]
+    favorite_positions: List[str]
+    payment_types: List[str]
+
+    # ── Underwriting Criteria ──
+    min_fico: int
+    min_monthly_revenue: float
+    min_time_in_business: int
+    max_monthly_nsfs: int
+    max_negative_days: int
+    min_days_since_last_funding: int
+    max_positions_allowed: int
+    min_ownership_percent: float
+    min_monthly_deposits: float
+    min_avg_ledger_balance: float
+    min_avg_daily_balance: float
+    max_holdback_percent: float
+
+    # ── Funding Limits ──
+    min_funding_amount: float
+    max_funding_amount: float
+    max_daily_ach: float
+
+    # ── Restrictions ──
+    restricted_states: FrozenSet[str]  # upper-cased state codes
+    restricted_industries: List[str]
+    preferred_industries: List[str]
+
+    # ── Policies ──
+    funds_defaults: str
+    non_usa_citizen_policy: str
+    tax_liens_accepted: str
+    tax_liens_notes: str
+
+    # ── Terms ──
+    term_range: str
+    buy_rates: str
+    buyout_net_rule: str
+    commission_structure: str
+    renewal_terms: str
+
+    # ── Operations ──
+    credit_pull_type: str
+    uw_fees: str
+    ach_wire: str
+    funding_cutoff: str
+    bank_login_methods: List[str]
+    ucc_filing: str
+    financials_threshold: str
+
+    # ── Business Rules ──
+    exclusivity_days: int
+    commission_payout_timeframe: str
+    has_renewal_program: bool
+    renewal_eligible_at_percent: float
+    has_stacking_program: bool
+    current_appetite: str
+    tier: str
+    is_active: bool
+    is_preferred: bool
+
+    # ── Canonical industry tokens for the inverted industry index ──
+    restricted_industries_norm: FrozenSet[str]
+    preferred_industries_norm: FrozenSet[str]
+    # ── Upper-cased Favorite Positions, matched against the next position label ──
+    favorite_positions_upper: FrozenSet[str]
+
+    def to_match_result(self, score: float) -> dict:
+        """Output record for an eligible lender (keys per _OUT_FIELDS)."""
+        result = dict(zip(_OUT_HEAD, _out_head(self)))
+        result["match_score"] = score
+        result.update(zip(_OUT_TAIL, _out_tail(self)))
+        # Give every result its own lists, not the Lender's
+        for key in _OUT_LIST_FIELDS:
+            result[key] = list(result[key])
+        return result
+
+
+# Keys of each "eligible_lenders" entry, in output order
+_OUT_FIELDS = (
+    "lender_name", "display_name", "product_types", "positions_accepted", "payment_types",
+    "match_score", "current_appetite", "tier", "is_preferred",
+    # Contact info for immediate outreach
+    "rep_contact_name", "rep_contact_email", "rep_phone", "submission_email",
+    # Funding limits
+    "min_funding_amount", "max_funding_amount", "max_daily_ach",
+    # Terms
+    "term_range", "buy_rates", "commission_structure",
+    # Operations
+    "credit_pull_type", "funding_cutoff", "bank_login_methods",
+)
+_SCORE_AT = _OUT_FIELDS.index("match_score")
+_OUT_HEAD = _OUT_FIELDS[:_SCORE_AT]
+_OUT_TAIL = _OUT_FIELDS[_SCORE_AT + 1:]
+_out_head = attrgetter(*_OUT_HEAD)
+_out_tail = attrgetter(*_OUT_TAIL)
+_OUT_LIST_FIELDS = ("product_types", "positions_accepted", "payment_types", "bank_login_methods")
+
+
+def match_lenders(deal_data: dict, lenders_csv_path: str, top_k: Optional[int] = None,
+                  include_reasons: bool = True) -> dict:
     """
     Main entry point. Check deal against all lenders in the CSV.
 
@@ -21,359 +183,659 @@ def match_lenders(deal_data: dict, lenders_csv_path: str) -> dict:
     2. Soft preferences (affects ranking but not eligibility)
     3. Match scoring (0-100 based on how well deal fits lender's sweet spot)
     4. Lender appetite weighting (HOT lenders ranked higher)
+
+    With `top_k`, only the k best-scoring eligible lenders are returned in
+    "eligible_lenders" ("eligible_count" still counts every eligible lender).
+    With include_reasons=False the "disqualified_lenders" list is left out
+    (only the counts are returned) and no reason text is built.
+    """
+    return match_lenders_batch([deal_data], lenders_csv_path, top_k, include_reasons)[0]
+
+
+def match_lenders_batch(deals: List[dict], lenders_csv_path: str,
+                        top_k: Optional[int] = None, include_reasons: bool = True) -> List[dict]:
+    """
+    Check several deals against the same lender CSV.
+    The CSV is loaded once and the hard disqualifications are evaluated as a
+    (deals x lenders) mask; returns one match_lenders() result per deal.
     """
     if not os.path.exists(lenders_csv_path):
-        return {
+        return [{
             "eligible_lenders": [],
             "disqualified_lenders": [],
             "total_lenders_checked": 0,
             "eligible_count": 0,
             "disqualified_count": 0,
             "error": f"Lender CSV not found: {lenders_csv_path}",
-        }
-
-    lenders = _load_lender_criteria(lenders_csv_path)
-    eligible = []
-    disqualified = []
-
-    for lender in lenders:
-        reasons = _check_hard_disqualifications(deal_data, lender)
-        if not reasons:
-            score = _calculate_match_score(deal_data, lender)
-            eligible.append({
-                "lender_name": lender["lender_name"],
-                "display_name": lender.get("display_name", lender["lender_name"]),
-                "product_types": lender.get("product_types", []),
-                "positions_accepted": lender.get("positions_accepted", []),
-                "payment_types": lender.get("payment_types", []),
-                "match_score": score,
-                "current_appetite": lender.get("current_appetite", "NORMAL"),
-                "tier": lender.get("tier", ""),
-                "is_preferred": lender.get("is_preferred", False),
-                # Contact info for immediate outreach
-                "rep_contact_name": lender.get("rep_contact_name", ""),
-                "rep_contact_email": lender.get("rep_contact_email", ""),
-                "rep_phone": lender.get("rep_phone", ""),
-                "submission_email": lender.get("submission_email", ""),
-                # Funding limits
-                "min_funding_amount": lender.get("min_funding_amount", 0),
-                "max_funding_amount": lender.get("max_funding_amount", 0),
-                "max_daily_ach": lender.get("max_daily_ach", 0),
-                # Terms
-                "term_range": lender.get("term_range", ""),
-                "buy_rates": lender.get("buy_rates", ""),
-                "commission_structure": lender.get("commission_structure", ""),
-                # Operations
-                "credit_pull_type": lender.get("credit_pull_type", ""),
-                "funding_cutoff": lender.get("funding_cutoff", ""),
-                "bank_login_methods": lender.get("bank_login_methods", []),
-            })
+        } for _ in deals]
+
+    lenders, arrays = _cached_lenders(lenders_csv_path)
+    n = len(lenders)
+
+    nds = [_normalize_deal(deal) for deal in deals]
+    restricted = np.zeros((len(nds), n), dtype=np.bool_)
+    for d, nd in enumerate(nds):
+        restricted[d] = _industry_mask(nd.industry_upper, arrays["restricted_industry_index"], n)
+    codes = _disqualification_codes(nds, arrays)
+    codes[(codes == ELIGIBLE) & restricted] = REASON_INDUSTRY
+
+    scores = np.zeros((len(nds), n), dtype=np.float64)
+    for d, nd in enumerate(nds):
+        scores[d] = _score_lenders(nd, arrays) + _preference_bonus(nd, arrays, n)
+
+    workers = os.cpu_count() or 1
+    if n >= _PARALLEL_MIN_LENDERS and workers > 1:
+        # Lender rows are independent: each worker takes a contiguous slice,
+        # and concatenating the slices in order keeps CSV order.
+        bounds = np.linspace(0, n, workers + 1, dtype=int)
+        slices = [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+            parts = list(pool.map(
+                _match_chunk,
+                repeat(nds),
+                [lenders[sl] for sl in slices],
+                [sl.start for sl in slices],
+                [codes[:, sl] for sl in slices],
+                [restricted[:, sl] for sl in slices],
+                [scores[:, sl] for sl in slices],
+                repeat(include_reasons),
+            ))
+    else:
+        parts = [_match_chunk(nds, lenders, 0, codes, restricted, scores, include_reasons)]
+
+    results = []
+    for d in range(len(nds)):
+        scored = [entry for part in parts for entry in part[d][0]]
+        disqualified_count = sum(part[d][2] for part in parts)
+
+        # Both orderings are stable, so ties keep CSV order
+        if top_k is None:
+            ranked = sorted(scored, key=itemgetter(0), reverse=True)
         else:
-            disqualified.append({
-                "lender_name": lender["lender_name"],
-                "reasons": reasons,
-            })
-
-    eligible.sort(key=lambda x: x["match_score"], reverse=True)
-
-    return {
-        "eligible_lenders": eligible,
-        "disqualified_lenders": disqualified,
-        "total_lenders_checked": len(lenders),
-        "eligible_count": len(eligible),
-        "disqualified_count": len(disqualified),
-    }
+            ranked = heapq.nlargest(top_k, scored, key=itemgetter(0))
+
+        result = {"eligible_lenders": [lenders[i].to_match_result(score) for score, i in ranked]}
+        if include_reasons:
+            result["disqualified_lenders"] = [
+                {"lender_name": name, "reasons": [_format_reason(code, args) for code, args in reasons]}
+                for part in parts for name, reasons in part[d][1]
+            ]
+        result["total_lenders_checked"] = n
+        result["eligible_count"] = len(scored)
+        result["disqualified_count"] = disqualified_count
+        results.append(result)
+    return results
+
+
+def _match_chunk(nds, lenders, offset, codes, restricted, scores, include_reasons=True) -> list:
+    """
+    Per-lender pass over one slice of the lender table (columns offset..)
+    for every deal. Returns, per deal, the (score, lender index) pairs of
+    eligible lenders, the (lender name, unformatted reasons) pairs of
+    disqualified ones (if include_reasons) and the disqualified count.
+    """
+    out = []
+    for d, nd in enumerate(nds):
+        if not include_reasons:
+            # Only eligibility matters for disqualified lenders here, and
+            # codes already holds it: visit just the eligible columns.
+            eligible = np.flatnonzero(codes[d] == ELIGIBLE).tolist()
+            scored = [(_clamp_score(scores[d, i]), offset + i) for i in eligible]
+            out.append((scored, [], len(lenders) - len(eligible)))
+            continue
+
+        scored = []
+        disqualified = []
+        rejected = 0
+        for i, lender in enumerate(lenders):
+            if codes[d, i] != ELIGIBLE:
+                rejected += 1
+                disqualified.append((lender.lender_name, _reasons_for(nd, lender, restricted[d, i])))
+                continue
+            scored.append((_clamp_score(scores[d, i]), offset + i))
+        out.append((scored, disqualified, rejected))
+    return out
 
 
 # ── CSV Loading (73-column template) ────────────────────────────────
 
-def _load_lender_criteria(csv_path: str) -> list:
-    """Parse the full 73-column lender criteria CSV into a list of dicts."""
-    lenders = []
-    with open(csv_path, 'r', newline='', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lender = {
-                # ── Basic Info ──
-                "lender_name": row.get("Lender Name", "").strip(),
-                "display_name": row.get("Display Name", "").strip() or row.get("Lender Name", "").strip(),
-                "submission_email": row.get("Submission Email", "").strip(),
-                "cc_email": row.get("CC Email", "").strip(),
-                "website": row.get("Website", "").strip(),
-                "rating": _safe_float(row.get("Rating", "0")),
-                "rep_contact_name": row.get("Rep Contact Name", "").strip(),
-                "rep_contact_email": row.get("Rep Contact Email", "").strip(),
-                "rep_phone": row.get("Rep Phone", "").strip(),
-
-                # ── Product Info ──
-                "product_types": _parse_list(row.get("Product Types", ""), sep="|"),
-                "positions_accepted": _parse_list(row.get("Positions Accepted", "")),
-                "favorite_positions": _parse_list(row.get("Favorite Positions", "")),
-                "payment_types": _parse_list(row.get("Payment Types", ""), sep="|"),
-
-                # ── Underwriting Criteria ──
-                "min_fico": _safe_int(row.get("Min FICO", "0")),
-                "min_monthly_revenue": _safe_float(row.get("Min Monthly Revenue", "0")),
-                "min_time_in_business": _safe_int(row.get("Min Time in Business", "0")),
-                "max_monthly_nsfs": _safe_int(row.get("Max Monthly NSFs", "999")),
-                "max_negative_days": _safe_int(row.get("Max Negative Days", "999")),
-                "min_days_since_last_funding": _safe_int(row.get("Min Days Since Last Funding", "0")),
-                "max_positions_allowed": _safe_int(row.get("Max Positions Allowed", "99")),
-                "min_ownership_percent": _safe_float(row.get("Min Ownership %", "0")),
-                "min_monthly_deposits": _safe_float(row.get("Min Monthly Deposits", "0")),
-                "min_avg_ledger_balance": _safe_float(row.get("Min Avg Ledger Balance", "0")),
-                # Backwards compat: also check legacy column name
-                "min_avg_daily_balance": _safe_float(
-                    row.get("Min Avg Ledger Balance", "") or row.get("Min Avg Daily Balance", "0")
-                ),
-                "max_holdback_percent": _safe_float(row.get("Max Remit Holdback %", "")
-                                                     or row.get("Max Holdback %", "100")),
-
-                # ── Funding Limits ──
-                "min_funding_amount": _safe_float(row.get("Min Funding Amount", "0")),
-                "max_funding_amount": _safe_float(row.get("Max Funding Amount", "0")),
-                "max_daily_ach": _safe_float(row.get("Max Daily ACH", "0")),
-
-                # ── Restrictions ──
-                "restricted_states": _parse_list(row.get("Restricted States", "")),
-                "restricted_industries": _parse_list(row.get("Restricted Industries", "")),
-                "preferred_industries": _parse_list(row.get("Preferred Industries", "")),
-
-                # ── Policies ──
-                "funds_defaults": row.get("Funds Defaults", "").strip(),
-                "non_usa_citizen_policy": row.get("Non-USA Citizen Policy", "").strip(),
-                "tax_liens_accepted": row.get("Tax Liens Accepted", "").strip(),
-                "tax_liens_notes": row.get("Tax Liens Notes", "").strip(),
-
-                # ── Terms ──
-                "term_range": row.get("Term Range", "").strip(),
-                "buy_rates": row.get("Buy Rates", "").strip(),
-                "buyout_net_rule": row.get("Buyout/Net Rule", "").strip(),
-                "commission_structure": row.get("Commission Structure", "").strip(),
-                "renewal_terms": row.get("Renewal Terms", "").strip(),
-
-                # ── Operations ──
-                "credit_pull_type": row.get("Credit Pull Type", "").strip(),
-                "uw_fees": row.get("UW Fees", "").strip(),
-                "ach_wire": row.get("ACH/Wire", "").strip(),
-                "funding_cutoff": row.get("Funding Cutoff", "").strip(),
-                "bank_login_methods": _parse_list(row.get("Bank Login Methods", ""), sep="|"),
-                "ucc_filing": row.get("UCC Filing", "").strip(),
-                "financials_threshold": row.get("Financials Threshold", "").strip(),
-
-                # ── Business Rules ──
-                "exclusivity_days": _safe_int(row.get("Exclusivity Days", "0")),
-                "commission_payout_timeframe": row.get("Commission Payout Timeframe", "").strip(),
-                "has_renewal_program": _parse_bool(row.get("Has Renewal Program", "")),
-                "renewal_eligible_at_percent": _safe_float(row.get("Renewal Eligible at %", "0")),
-                "has_stacking_program": _parse_bool(row.get("Has Stacking Program", "")),
-                "current_appetite": row.get("Current Appetite", "NORMAL").strip().upper(),
-                "tier": row.get("Tier", "").strip().upper(),
-                "is_active": _parse_bool(row.get("Is Active", "True")),
-                "is_preferred": _parse_bool(row.get("Is Preferred", "")),
-            }
-            lenders.append(lender)
-    return lenders
+# Parsed lender tables by absolute path: (mtime_ns, size) -> lenders, arrays.
+# Re-parsed whenever the file changes on disk.
+_LENDER_CACHE: Dict[str, tuple] = {}
+
+
+def _cached_lenders(csv_path: str) -> tuple:
+    """Return (lenders, arrays) for the CSV, parsing it only when it changed."""
+    st = os.stat(csv_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.path.abspath(csv_path)
+    cached = _LENDER_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    lenders = _load_lender_criteria(csv_path)
+    arrays = _build_lender_arrays(lenders)
+    _LENDER_CACHE[key] = (stamp, lenders, arrays)
+    return lenders, arrays
+
+
+def _load_lender_criteria(csv_path: str) -> List[Lender]:
+    """
+    Parse the full 73-column lender criteria CSV into a list of Lender records.
+    The file is tokenized by pandas' C reader as plain strings, then parsed
+    column by column, once per distinct value (see _parse_column), since
+    lender tables repeat the same few values down every column.
+    """
+    try:
+        df = pd.read_csv(csv_path, dtype=str, encoding='utf-8-sig', na_filter=False, index_col=False,
+                         usecols=lambda name: name in _KNOWN_COLUMNS)
+    except pd.errors.EmptyDataError:
+        return []
+    raw_columns = dict(zip(df.columns, df.to_numpy(dtype=object).T.tolist()))
+    n = len(df)
+
+    columns = {}
+    for field, names, default, parse in _LENDER_COLUMNS:
+        raw = raw_columns.get(names[-1], [default] * n)
+        # Earlier names take precedence when non-empty
+        for name in reversed(names[:-1]):
+            if name in raw_columns:
+                raw = [v or r for v, r in zip(raw_columns[name], raw)]
+        columns[field] = _parse_column(raw, parse)
+
+    columns["display_name"] = [
+        d or name for d, name in zip(columns["display_name"], columns["lender_name"])
+    ]
+    columns["restricted_industries_norm"] = [
+        frozenset(i.upper() for i in industries) for industries in columns["restricted_industries"]
+    ]
+    columns["preferred_industries_norm"] = [
+        frozenset(i.upper() for i in industries) for industries in columns["preferred_industries"]
+    ]
+    columns["favorite_positions_upper"] = [
+        frozenset(fp.strip().upper() for fp in positions) for positions in columns["favorite_positions"]
+    ]
+
+    ordered = [columns[f.name] for f in fields(Lender)]
+    return [Lender(*values) for values in zip(*ordered)]
+
+
+def _parse_column(values: list, parse) -> list:
+    """Apply `parse` to a column, once per distinct value."""
+    lookup = {v: parse(v) for v in set(values)}
+    if parse in _LIST_PARSERS:
+        # Lists are mutable, so every lender gets its own copy
+        return [list(lookup[v]) for v in values]
+    return [lookup[v] for v in values]
+
+
+# ── Deal normalization ──────────────────────────────────────────────
+
+class _NormalizedDeal(NamedTuple):
+    """Deal-side values, read and normalized once per deal instead of per lender."""
+    # Numeric fields first (see _N_NUMERIC), raw values as given by the caller
+    fico: float
+    rev: float
+    tib: float
+    nsf: float
+    neg: float
+    pos: int
+    days_since: float
+    ownership: float
+    adb: float
+    holdback: float
+    monthly_deposits: float
+    # String fields
+    state_upper: str
+    industry: str
+    industry_upper: str
+    next_pos_label_upper: str
+
+
+_N_NUMERIC = 11
+
+
+def _normalize_deal(deal: dict) -> _NormalizedDeal:
+    position_count = deal.get("position_count", 0)
+    industry = deal.get("industry", "")
+    return _NormalizedDeal(
+        fico=deal.get("fico_score", 0),
+        rev=deal.get("monthly_revenue", 0),
+        tib=deal.get("time_in_business_months", 0),
+        nsf=deal.get("nsf_count", 0),
+        neg=deal.get("negative_days", 0),
+        pos=position_count,
+        days_since=deal.get("days_since_last_funding", 0),
+        ownership=deal.get("ownership_percent", 100),
+        adb=deal.get("avg_daily_balance", 0),
+        holdback=deal.get("current_holdback_percent", 0),
+        monthly_deposits=deal.get("monthly_deposits", 0),
+        state_upper=deal.get("state", "").upper().strip(),
+        industry=industry,
+        industry_upper=industry.upper().strip(),
+        next_pos_label_upper=_position_to_label(position_count + 1).upper(),
+    )
 
 
 # ── Hard Disqualifications ──────────────────────────────────────────
 
-def _check_hard_disqualifications(deal: dict, lender: dict) -> list:
+# Reason codes, in the order the checks run: most common rejections first.
+# _disqualification_codes() reports the first failing check per lender.
+ELIGIBLE = 0
+REASON_INACTIVE = 1
+REASON_PAUSED = 2
+REASON_STATE = 3
+REASON_FICO = 4
+REASON_REVENUE = 5
+REASON_TIME_IN_BUSINESS = 6
+REASON_POSITIONS = 7
+REASON_NSF = 8
+REASON_NEGATIVE_DAYS = 9
+REASON_DAYS_SINCE_FUNDING = 10
+REASON_HOLDBACK = 11
+REASON_ADB = 12
+REASON_OWNERSHIP = 13
+REASON_DEPOSITS = 14
+REASON_INDUSTRY = 15
+
+
+def _reasons_for(nd: _NormalizedDeal, lender: Lender, industry_restricted: bool = False) -> list:
     """
     Check all hard disqualification criteria.
-    Returns list of failure reasons (empty = eligible).
+    Returns list of failure reasons (empty = eligible) as (code, args)
+    pairs; _format_reason() renders them to text.
     If ANY criterion fails, the lender is OUT.
+    `industry_restricted` comes from the restricted-industry index lookup.
+    Only called for lenders that need their reasons reported.
     """
     reasons = []
 
     # Is Active check
-    if not lender.get("is_active", True):
-        reasons.append("Lender is not currently active")
+    if not lender.is_active:
+        reasons.append((REASON_INACTIVE, ()))
         return reasons  # No need to check further
 
     # Current Appetite = PAUSED
-    appetite = lender.get("current_appetite", "NORMAL")
+    appetite = lender.current_appetite
     if appetite == "PAUSED":
-        reasons.append("Lender appetite is PAUSED")
+        reasons.append((REASON_PAUSED, ()))
         return reasons
 
     # FICO
-    fico = deal.get("fico_score", 0)
-    if fico > 0 and lender["min_fico"] > 0 and fico < lender["min_fico"]:
-        reasons.append(f"FICO {fico} below minimum {lender['min_fico']}")
+    fico = nd.fico
+    if fico > 0 and lender.min_fico > 0 and fico < lender.min_fico:
+        reasons.append((REASON_FICO, (fico, lender.min_fico)))
 
     # Monthly Revenue
-    rev = deal.get("monthly_revenue", 0)
-    if lender["min_monthly_revenue"] > 0 and rev < lender["min_monthly_revenue"]:
-        reasons.append(f"Monthly revenue ${rev:,.0f} below minimum ${lender['min_monthly_revenue']:,.0f}")
+    rev = nd.rev
+    if lender.min_monthly_revenue > 0 and rev < lender.min_monthly_revenue:
+        reasons.append((REASON_REVENUE, (rev, lender.min_monthly_revenue)))
 
     # Time in Business
-    tib = deal.get("time_in_business_months", 0)
-    if tib > 0 and lender["min_time_in_business"] > 0 and tib < lender["min_time_in_business"]:
-        reasons.append(f"Time in business {tib}mo below minimum {lender['min_time_in_business']}mo")
+    tib = nd.tib
+    if tib > 0 and lender.min_time_in_business > 0 and tib < lender.min_time_in_business:
+        reasons.append((REASON_TIME_IN_BUSINESS, (tib, lender.min_time_in_business)))
 
     # NSF Count
-    nsf = deal.get("nsf_count", 0)
-    if lender["max_monthly_nsfs"] < 999 and nsf > lender["max_monthly_nsfs"]:
-        reasons.append(f"NSF count {nsf} exceeds maximum {lender['max_monthly_nsfs']}")
+    nsf = nd.nsf
+    if lender.max_monthly_nsfs < 999 and nsf > lender.max_monthly_nsfs:
+        reasons.append((REASON_NSF, (nsf, lender.max_monthly_nsfs)))
 
     # Negative Days
-    neg_days = deal.get("negative_days", 0)
-    if lender["max_negative_days"] < 999 and neg_days > lender["max_negative_days"]:
-        reasons.append(f"Negative days {neg_days} exceeds maximum {lender['max_negative_days']}")
+    neg_days = nd.neg
+    if lender.max_negative_days < 999 and neg_days > lender.max_negative_days:
+        reasons.append((REASON_NEGATIVE_DAYS, (neg_days, lender.max_negative_days)))
 
     # Position Count
-    positions = deal.get("position_count", 0)
-    if lender["max_positions_allowed"] < 99 and positions > lender["max_positions_allowed"]:
-        reasons.append(f"Position count {positions} exceeds maximum {lender['max_positions_allowed']}")
+    positions = nd.pos
+    if lender.max_positions_allowed < 99 and positions > lender.max_positions_allowed:
+        reasons.append((REASON_POSITIONS, (positions, lender.max_positions_allowed)))
 
     # Days Since Last Funding
-    days_since = deal.get("days_since_last_funding", 0)
-    if lender["min_days_since_last_funding"] > 0 and days_since < lender["min_days_since_last_funding"]:
-        reasons.append(
-            f"Days since last funding {days_since} below minimum {lender['min_days_since_last_funding']}"
-        )
+    days_since = nd.days_since
+    if lender.min_days_since_last_funding > 0 and days_since < lender.min_days_since_last_funding:
+        reasons.append((REASON_DAYS_SINCE_FUNDING, (days_since, lender.min_days_since_last_funding)))
 
     # Ownership Percent
-    ownership = deal.get("ownership_percent", 100)
-    if lender["min_ownership_percent"] > 0 and ownership < lender["min_ownership_percent"]:
-        reasons.append(f"Ownership {ownership}% below minimum {lender['min_ownership_percent']}%")
+    ownership = nd.ownership
+    if lender.min_ownership_percent > 0 and ownership < lender.min_ownership_percent:
+        reasons.append((REASON_OWNERSHIP, (ownership, lender.min_ownership_percent)))
 
     # Avg Ledger Balance (ADB)
-    adb = deal.get("avg_daily_balance", 0)
-    min_adb = max(lender.get("min_avg_ledger_balance", 0), lender.get("min_avg_daily_balance", 0))
+    adb = nd.adb
+    min_adb = max(lender.min_avg_ledger_balance, lender.min_avg_daily_balance)
     if min_adb > 0 and adb < min_adb:
-        reasons.append(f"Avg ledger balance ${adb:,.0f} below minimum ${min_adb:,.0f}")
+        reasons.append((REASON_ADB, (adb, min_adb)))
 
     # Holdback %
-    holdback = deal.get("current_holdback_percent", 0)
-    if lender["max_holdback_percent"] < 100 and holdback > lender["max_holdback_percent"]:
-        reasons.append(f"Current holdback {holdback:.1f}% exceeds maximum {lender['max_holdback_percent']}%")
+    holdback = nd.holdback
+    if lender.max_holdback_percent < 100 and holdback > lender.max_holdback_percent:
+        reasons.append((REASON_HOLDBACK, (holdback, lender.max_holdback_percent)))
 
     # Monthly Deposits
-    monthly_deposits = deal.get("monthly_deposits", 0)
-    if lender["min_monthly_deposits"] > 0 and monthly_deposits > 0 and monthly_deposits < lender["min_monthly_deposits"]:
-        reasons.append(
-            f"Monthly deposits {monthly_deposits} below minimum {lender['min_monthly_deposits']:.0f}"
-        )
+    monthly_deposits = nd.monthly_deposits
+    if lender.min_monthly_deposits > 0 and monthly_deposits > 0 and monthly_deposits < lender.min_monthly_deposits:
+        reasons.append((REASON_DEPOSITS, (monthly_deposits, lender.min_monthly_deposits)))
 
     # Restricted States
-    state = deal.get("state", "").upper().strip()
-    if state and lender["restricted_states"]:
-        restricted_upper = [s.upper().strip() for s in lender["restricted_states"]]
-        if state in restricted_upper:
-            reasons.append(f"State '{state}' is restricted")
+    state = nd.state_upper
+    if state and state in lender.restricted_states:
+        reasons.append((REASON_STATE, (state,)))
 
     # Restricted Industries
-    industry = deal.get("industry", "").upper().strip()
-    if industry and lender["restricted_industries"]:
-        for ri in lender["restricted_industries"]:
-            if ri.upper().strip() in industry or industry in ri.upper().strip():
-                reasons.append(f"Industry '{deal.get('industry', '')}' is restricted")
-                break
+    if industry_restricted:
+        reasons.append((REASON_INDUSTRY, (nd.industry,)))
 
     return reasons
 
 
+_REASON_FORMATS = {
+    REASON_INACTIVE: "Lender is not currently active",
+    REASON_PAUSED: "Lender appetite is PAUSED",
+    REASON_FICO: "FICO {} below minimum {}",
+    REASON_REVENUE: "Monthly revenue ${:,.0f} below minimum ${:,.0f}",
+    REASON_TIME_IN_BUSINESS: "Time in business {}mo below minimum {}mo",
+    REASON_NSF: "NSF count {} exceeds maximum {}",
+    REASON_NEGATIVE_DAYS: "Negative days {} exceeds maximum {}",
+    REASON_POSITIONS: "Position count {} exceeds maximum {}",
+    REASON_DAYS_SINCE_FUNDING: "Days since last funding {} below minimum {}",
+    REASON_OWNERSHIP: "Ownership {}% below minimum {}%",
+    REASON_ADB: "Avg ledger balance ${:,.0f} below minimum ${:,.0f}",
+    REASON_HOLDBACK: "Current holdback {:.1f}% exceeds maximum {}%",
+    REASON_DEPOSITS: "Monthly deposits {} below minimum {:.0f}",
+    REASON_STATE: "State '{}' is restricted",
+    REASON_INDUSTRY: "Industry '{}' is restricted",
+}
+
+
+def _format_reason(code: int, args: tuple) -> str:
+    return _REASON_FORMATS[code].format(*args)
+
+
+def _disqualification_codes(nds: List[_NormalizedDeal], arrays: dict) -> np.ndarray:
+    """
+    Hard disqualification checks (minus the industry check) for several
+    deals at once: deal values are stacked as (D, 1) columns and broadcast
+    against the (L,) lender columns. Returns a (D, L) int8 matrix of
+    first-failure reason codes (ELIGIBLE = 0 where every check passes).
+    """
+    numeric = np.array([nd[:_N_NUMERIC] for nd in nds], dtype=np.float64).reshape(len(nds), _N_NUMERIC)
+    (fico, rev, tib, nsf, neg_days, positions, days_since,
+     ownership, adb, holdback, monthly_deposits) = (col[:, None] for col in numeric.T)
+
+    a = arrays
+    state_restricted = np.zeros((len(nds), len(a["min_fico"])), dtype=np.bool_)
+    for d, nd in enumerate(nds):
+        hit = a["restricted_state_index"].get(nd.state_upper)
+        if hit is not None:
+            state_restricted[d, hit] = True
+
+    checks = (
+        (REASON_INACTIVE, ~a["is_active"]),
+        (REASON_PAUSED, a["is_paused"]),
+        (REASON_STATE, state_restricted),
+        (REASON_FICO, (fico > 0) & (a["min_fico"] > 0) & (fico < a["min_fico"])),
+        (REASON_REVENUE, (a["min_monthly_revenue"] > 0) & (rev < a["min_monthly_revenue"])),
+        (REASON_TIME_IN_BUSINESS,
+         (tib > 0) & (a["min_time_in_business"] > 0) & (tib < a["min_time_in_business"])),
+        (REASON_POSITIONS, (a["max_positions_allowed"] < 99) & (positions > a["max_positions_allowed"])),
+        (REASON_NSF, (a["max_monthly_nsfs"] < 999) & (nsf > a["max_monthly_nsfs"])),
+        (REASON_NEGATIVE_DAYS, (a["max_negative_days"] < 999) & (neg_days > a["max_negative_days"])),
+        (REASON_DAYS_SINCE_FUNDING,
+         (a["min_days_since_last_funding"] > 0) & (days_since < a["min_days_since_last_funding"])),
+        (REASON_HOLDBACK, (a["max_holdback_percent"] < 100) & (holdback > a["max_holdback_percent"])),
+        (REASON_ADB, (a["min_adb"] > 0) & (adb < a["min_adb"])),
+        (REASON_OWNERSHIP, (a["min_ownership_percent"] > 0) & (ownership < a["min_ownership_percent"])),
+        (REASON_DEPOSITS, (a["min_monthly_deposits"] > 0) & (monthly_deposits > 0)
+         & (monthly_deposits < a["min_monthly_deposits"])),
+    )
+
+    codes = np.zeros(state_restricted.shape, dtype=np.int8)
+    # Apply in reverse so the earliest failing check's code wins
+    for code, failed in reversed(checks):
+        np.putmask(codes, np.broadcast_to(failed, codes.shape), code)
+    return codes
+
+
 # ── Match Scoring ───────────────────────────────────────────────────
+#
+# The numeric soft preferences are scored for every lender in one pass over
+# struct-of-arrays columns built from the parsed CSV, as whole-array NumPy
+# expressions. Industry / position preferences are string matches, looked up
+# through inverted indexes and added as a bonus array.
+
+APPETITE_CODES = {"PAUSED": 0, "SLOW": 1, "NORMAL": 2, "HOT": 3}
+TIER_CODES = {"D": 1, "C": 2, "B": 3, "A": 4}
+
+# Score adjustment per appetite / tier; unknown values score 0
+_APPETITE_SCORE = {"HOT": 15, "NORMAL": 5, "SLOW": -5, "PAUSED": 0}
+_TIER_SCORE = {"A": 10, "B": 5, "C": 0, "D": -5}
 
-def _calculate_match_score(deal: dict, lender: dict) -> float:
+
+def _build_lender_arrays(lenders: list) -> dict:
     """
-    Score 0-100 for how well the deal fits the lender.
-    Starts at 50, adds/subtracts based on soft preferences, caps at 100.
-
-    Soft Preferences:
-    - Industry in Preferred Industries: +10
-    - Position matches Favorite Positions: +10
-    - Current Appetite = HOT: +15
-    - Current Appetite = NORMAL: +5
-    - Is Preferred = True: +10
-    - Tier A: +10
-    - FICO significantly above minimum: +5
-    - Revenue significantly above minimum: +5
+    Build struct-of-arrays columns for the numeric scoring fields and the
+    hard-disqualification criteria.
+    """
+    n = len(lenders)
+    arrays = {
+        "min_fico": np.empty(n, dtype=np.float64),
+        "min_monthly_revenue": np.empty(n, dtype=np.float64),
+        "max_monthly_nsfs": np.empty(n, dtype=np.float64),
+        "max_negative_days": np.empty(n, dtype=np.float64),
+        "appetite_code": np.empty(n, dtype=np.int8),
+        "tier_code": np.empty(n, dtype=np.int8),
+        "is_preferred": np.empty(n, dtype=np.bool_),
+        # Eligibility-only columns
+        "is_active": np.empty(n, dtype=np.bool_),
+        "is_paused": np.empty(n, dtype=np.bool_),
+        "min_time_in_business": np.empty(n, dtype=np.float64),
+        "max_positions_allowed": np.empty(n, dtype=np.float64),
+        "min_days_since_last_funding": np.empty(n, dtype=np.float64),
+        "min_ownership_percent": np.empty(n, dtype=np.float64),
+        "min_adb": np.empty(n, dtype=np.float64),
+        "max_holdback_percent": np.empty(n, dtype=np.float64),
+        "min_monthly_deposits": np.empty(n, dtype=np.float64),
+        "restricted_state_index": _build_set_index(lenders, "restricted_states"),
+        "favorite_position_index": _build_set_index(lenders, "favorite_positions_upper"),
+        "restricted_industry_index": _build_industry_index(lenders, "restricted_industries_norm"),
+        "preferred_industry_index": _build_industry_index(lenders, "preferred_industries_norm"),
+    }
+    for i, lender in enumerate(lenders):
+        arrays["min_fico"][i] = lender.min_fico
+        arrays["min_monthly_revenue"][i] = lender.min_monthly_revenue
+        arrays["max_monthly_nsfs"][i] = lender.max_monthly_nsfs
+        arrays["max_negative_days"][i] = lender.max_negative_days
+        arrays["appetite_code"][i] = APPETITE_CODES.get(lender.current_appetite, 0)
+        arrays["tier_code"][i] = TIER_CODES.get(lender.tier, 0)
+        arrays["is_preferred"][i] = lender.is_preferred
+        arrays["is_active"][i] = lender.is_active
+        arrays["is_paused"][i] = lender.current_appetite == "PAUSED"
+        arrays["min_time_in_business"][i] = lender.min_time_in_business
+        arrays["max_positions_allowed"][i] = lender.max_positions_allowed
+        arrays["min_days_since_last_funding"][i] = lender.min_days_since_last_funding
+        arrays["min_ownership_percent"][i] = lender.min_ownership_percent
+        arrays["min_adb"][i] = max(lender.min_avg_ledger_balance, lender.min_avg_daily_balance)
+        arrays["max_holdback_percent"][i] = lender.max_holdback_percent
+        arrays["min_monthly_deposits"][i] = lender.min_monthly_deposits
+    return arrays
+
+
+def _build_set_index(lenders: list, key: str) -> dict:
+    """Inverted index: code in each lender's `key` set (states, positions) -> array of lender indices."""
+    index = {}
+    for i, lender in enumerate(lenders):
+        for code in getattr(lender, key):
+            index.setdefault(code, []).append(i)
+    return {code: np.array(idx, dtype=np.intp) for code, idx in index.items()}
+
+
+class _IndustryIndex(NamedTuple):
+    """Restricted/preferred industry tokens of every lender, for substring search."""
+    postings: Dict[str, np.ndarray]  # token -> lender indices listing it
+    tokens: List[str]
+    joined: str                      # tokens joined by _TOKEN_SEP
+    starts: List[int]                # offset of each token within `joined`
+    automaton: object                # Aho-Corasick automaton over tokens, or None
+
+
+_TOKEN_SEP = "\x00"
+
+
+def _build_industry_index(lenders: list, key: str) -> _IndustryIndex:
+    """Inverted index: canonical industry token -> array of lender indices."""
+    index = {}
+    for i, lender in enumerate(lenders):
+        for token in getattr(lender, key):
+            index.setdefault(token, []).append(i)
+    postings = {token: np.array(idx, dtype=np.intp) for token, idx in index.items()}
+
+    tokens = list(postings)
+    starts = []
+    offset = 0
+    for token in tokens:
+        starts.append(offset)
+        offset += len(token) + len(_TOKEN_SEP)
+
+    automaton = None
+    if AHOCORASICK_AVAILABLE and tokens:
+        automaton = ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+
+    return _IndustryIndex(postings, tokens, _TOKEN_SEP.join(tokens), starts, automaton)
+
+
+def _industry_mask(industry: str, index: _IndustryIndex, n: int) -> np.ndarray:
     """
-    score = 50.0
-
-    # ── Appetite weighting ──
-    appetite = lender.get("current_appetite", "NORMAL").upper()
-    if appetite == "HOT":
-        score += 15
-    elif appetite == "NORMAL":
-        score += 5
-    elif appetite == "SLOW":
-        score -= 5
-
-    # ── Preferred lender bonus ──
-    if lender.get("is_preferred", False):
-        score += 10
-
-    # ── Tier bonus ──
-    tier = lender.get("tier", "").upper()
-    if tier == "A":
-        score += 10
-    elif tier == "B":
-        score += 5
-    elif tier == "C":
-        score += 0
-    elif tier == "D":
-        score -= 5
+    Flag every lender with an industry token matching the deal's industry
+    (either string contained in the other). Tokens inside the industry are
+    found in one pass of the Aho-Corasick automaton (or a scan of the
+    distinct tokens without pyahocorasick); the industry inside a token is
+    found with str.find over all tokens joined into one string.
+    """
+    mask = np.zeros(n, dtype=np.bool_)
+    if not industry:
+        return mask
 
-    # ── Preferred Industry match ──
-    industry = deal.get("industry", "").upper().strip()
-    if industry and lender.get("preferred_industries"):
-        for pi in lender["preferred_industries"]:
-            if pi.upper().strip() in industry or industry in pi.upper().strip():
-                score += 10
-                break
+    matched = set()
+    if index.automaton is not None:
+        matched.update(token for _, token in index.automaton.iter(industry))
+    else:
+        matched.update(token for token in index.tokens if token in industry)
 
-    # ── Favorite Position match ──
-    position_count = deal.get("position_count", 0)
-    fav_positions = lender.get("favorite_positions", [])
-    if fav_positions:
-        pos_label = _position_to_label(position_count + 1)  # next position
-        for fp in fav_positions:
-            if fp.strip().upper() == pos_label.upper():
-                score += 10
-                break
+    joined, starts, tokens = index.joined, index.starts, index.tokens
+    pos = joined.find(industry)
+    while pos != -1:
+        k = bisect_right(starts, pos) - 1
+        if pos + len(industry) <= starts[k] + len(tokens[k]):
+            matched.add(tokens[k])
+        # Rest of this token can't add anything new; resume at the next one
+        pos = joined.find(industry, starts[k + 1]) if k + 1 < len(tokens) else -1
+
+    for token in matched:
+        mask[index.postings[token]] = True
+    return mask
+
+
+def _bonus_table(codes: dict, scores: dict) -> np.ndarray:
+    """Lookup table indexed by code; slot 0 doubles as "unknown"."""
+    table = np.zeros(max(codes.values()) + 1, dtype=np.float64)
+    for value, code in codes.items():
+        table[code] = scores[value]
+    return table
+
+
+_APPETITE_BONUS = _bonus_table(APPETITE_CODES, _APPETITE_SCORE)
+_TIER_BONUS = _bonus_table(TIER_CODES, _TIER_SCORE)
+
+
+def _score_vec(fico, rev, nsf, neg, min_fico, min_rev, max_nsf, max_neg,
+               appetite_code, tier_code, is_preferred):
+    """
+    Base match score (before clamping) for every lender.
+    Starts at 50, adds/subtracts based on the numeric soft preferences:
+
+    - Current Appetite = HOT: +15, NORMAL: +5, SLOW: -5
+    - Is Preferred = True: +10
+    - Tier A: +10, B: +5, D: -5
+    - FICO significantly above minimum: +3 / +5
+    - Revenue significantly above minimum: +3 / +5
+    - NSF / negative-day headroom: up to +5 each
+
+    Written as branch-free whole-array arithmetic (table lookups and
+    boolean masks), so it runs vectorized in NumPy. The headroom caps use
+    np.fmin so a NaN deal value caps at +5, as the builtin min() did,
+    instead of turning the whole score into NaN.
+    """
+    # ── Appetite weighting / preferred lender / tier bonus ──
+    score = 50.0 + _APPETITE_BONUS[appetite_code]
+    score = score + 10.0 * is_preferred
+    score = score + _TIER_BONUS[tier_code]
 
     # ── FICO headroom ──
-    fico = deal.get("fico_score", 0)
-    min_fico = lender.get("min_fico", 0)
-    if min_fico > 0 and fico > 0:
-        diff = fico - min_fico
-        if diff >= 100:
-            score += 5
-        elif diff >= 50:
-            score += 3
+    diff = fico - min_fico
+    has_fico = (min_fico > 0) & (fico > 0)
+    score = score + has_fico * (5.0 * (diff >= 100) + 3.0 * ((diff >= 50) & (diff < 100)))
 
     # ── Revenue headroom ──
-    rev = deal.get("monthly_revenue", 0)
-    min_rev = lender.get("min_monthly_revenue", 0)
-    if min_rev > 0 and rev > 0:
-        ratio = rev / min_rev
-        if ratio >= 2.0:
-            score += 5
-        elif ratio >= 1.5:
-            score += 3
+    ratio = rev / np.where(min_rev > 0, min_rev, 1.0)
+    has_rev = (min_rev > 0) & (rev > 0)
+    score = score + has_rev * (5.0 * (ratio >= 2.0) + 3.0 * ((ratio >= 1.5) & (ratio < 2.0)))
 
     # ── NSF headroom (low NSFs relative to max allowed) ──
-    nsf = deal.get("nsf_count", 0)
-    max_nsf = lender.get("max_monthly_nsfs", 999)
-    if max_nsf < 999 and max_nsf > 0:
-        remaining = max_nsf - nsf
-        score += min(5, remaining * 1.5)
-    elif nsf == 0:
-        score += 5
+    nsf_cap = (max_nsf < 999) & (max_nsf > 0)
+    score = score + np.where(nsf_cap, np.fmin(5.0, (max_nsf - nsf) * 1.5), 5.0 * (nsf == 0))
 
     # ── Negative day headroom ──
-    neg = deal.get("negative_days", 0)
-    max_neg = lender.get("max_negative_days", 999)
-    if max_neg < 999 and max_neg > 0:
-        remaining = max_neg - neg
-        score += min(5, remaining)
-    elif neg == 0:
-        score += 5
+    neg_cap = (max_neg < 999) & (max_neg > 0)
+    score = score + np.where(neg_cap, np.fmin(5.0, max_neg - neg), 5.0 * (neg == 0))
+
+    return score
+
+
+def _score_lenders(nd: _NormalizedDeal, arrays: dict) -> np.ndarray:
+    """Run the scoring kernel for one deal against every lender column."""
+    return _score_vec(
+        float(nd.fico),
+        float(nd.rev),
+        float(nd.nsf),
+        float(nd.neg),
+        arrays["min_fico"],
+        arrays["min_monthly_revenue"],
+        arrays["max_monthly_nsfs"],
+        arrays["max_negative_days"],
+        arrays["appetite_code"],
+        arrays["tier_code"],
+        arrays["is_preferred"],
+    )
+
+
+def _preference_bonus(nd: _NormalizedDeal, arrays: dict, n: int) -> np.ndarray:
+    """
+    String-based soft preferences, resolved through the lender indexes
+    rather than per-lender string tests:
+    - Industry in Preferred Industries: +10 (from the preferred-industry index)
+    - Position matches Favorite Positions: +10 (from the favorite-position index)
+    Every entry is 0, 10 or 20 exactly, so adding it to the kernel's base
+    score rounds the same as adding the bonuses one lender at a time.
+    """
+    # ── Preferred Industry match ──
+    bonus = 10.0 * _industry_mask(nd.industry_upper, arrays["preferred_industry_index"], n)
+
+    # ── Favorite Position match ──
+    hit = arrays["favorite_position_index"].get(nd.next_pos_label_upper)
+    if hit is not None:
+        bonus[hit] += 10.0
 
+    return bonus
+
+
+def _clamp_score(score: float) -> float:
+    """Final 0-100 match score (base score plus preference bonus), to one decimal."""
+    score = float(score)
+    if score != score:  # NaN would otherwise pass both bounds as 100
+        return 0.0
     return round(max(0, min(100, score)), 1)
 
 
@@ -381,6 +843,10 @@ def _calculate_match_score(deal: dict, lender: dict) -> float:
 
 def _safe_int(val: str) -> int:
     try:
+        # int()/float() ignore surrounding whitespace themselves, so clean
+        # cells skip the strip/replace copies
+        if isinstance(val, str) and "," not in val:
+            return int(val)
         return int(str(val).strip().replace(",", ""))
     except (ValueError, TypeError):
         return 0
@@ -388,15 +854,35 @@ def _safe_int(val: str) -> int:
 
 def _safe_float(val: str) -> float:
     try:
+        if isinstance(val, str) and "," not in val and "%" not in val and "$" not in val:
+            return float(val)
         return float(str(val).strip().replace(",", "").replace("%", "").replace("$", ""))
     except (ValueError, TypeError):
         return 0.0
 
 
+_SPLIT_COMMA = re.compile(r"\s*,\s*")
+_SPLIT_PIPE = re.compile(r"\s*\|\s*")
+_LIST_SPLITTERS = {",": _SPLIT_COMMA, "|": _SPLIT_PIPE}
+
+
 def _parse_list(val: str, sep: str = ",") -> list:
-    if not val or not val.strip():
+    if not val:
         return []
-    return [item.strip() for item in val.split(sep) if item.strip()]
+    splitter = _LIST_SPLITTERS.get(sep)
+    if splitter is None:
+        return [item.strip() for item in val.split(sep) if item.strip()]
+    # The pattern swallows the whitespace around each separator, so tokens
+    # come back already stripped
+    return [item for item in splitter.split(val.strip()) if item]
+
+
+def _parse_pipe_list(val: str) -> list:
+    return _parse_list(val, sep="|")
+
+
+def _parse_code_set(val: str) -> FrozenSet[str]:
+    return frozenset(s.upper().strip() for s in _parse_list(val))
 
 
 def _parse_bool(val: str) -> bool:
@@ -405,12 +891,112 @@ def _parse_bool(val: str) -> bool:
     return str(val).strip().upper() in ("TRUE", "YES", "1", "Y")
 
 
+def _parse_upper(val: str) -> str:
+    return sys.intern(val.strip().upper())
+
+
+def _parse_category(val: str) -> str:
+    """Short values shared by many lenders (Yes/No, Hard/Soft, ...)."""
+    return sys.intern(val.strip())
+
+
+_POS_LABELS = ("", "1st", "2nd", "3rd", "4th", "5th+")
+
+
 def _position_to_label(pos_num: int) -> str:
     """Convert numeric position to label (1 -> '1st', 2 -> '2nd', etc.)"""
-    labels = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th", 5: "5th+"}
     if pos_num >= 5:
         return "5th+"
-    return labels.get(pos_num, f"{pos_num}th")
+    if pos_num >= 1 and pos_num == int(pos_num):
+        return _POS_LABELS[int(pos_num)]
+    return f"{pos_num}th"
+
+
+# ── 73-column template layout ────────────────────────────────────────
+#
+# (Lender field, CSV column(s), default when the column is absent, parser).
+# With several columns, the first non-empty one wins; the last one is the
+# legacy name and falls back to the default.
+
+_LENDER_COLUMNS = (
+    # ── Basic Info ──
+    ("lender_name", ("Lender Name",), "", str.strip),
+    ("display_name", ("Display Name",), "", str.strip),
+    ("submission_email", ("Submission Email",), "", str.strip),
+    ("cc_email", ("CC Email",), "", str.strip),
+    ("website", ("Website",), "", str.strip),
+    ("rating", ("Rating",), "0", _safe_float),
+    ("rep_contact_name", ("Rep Contact Name",), "", str.strip),
+    ("rep_contact_email", ("Rep Contact Email",), "", str.strip),
+    ("rep_phone", ("Rep Phone",), "", str.strip),
+
+    # ── Product Info ──
+    ("product_types", ("Product Types",), "", _parse_pipe_list),
+    ("positions_accepted", ("Positions Accepted",), "", _parse_list),
+    ("favorite_positions", ("Favorite Positions",), "", _parse_list),
+    ("payment_types", ("Payment Types",), "", _parse_pipe_list),
+
+    # ── Underwriting Criteria ──
+    ("min_fico", ("Min FICO",), "0", _safe_int),
+    ("min_monthly_revenue", ("Min Monthly Revenue",), "0", _safe_float),
+    ("min_time_in_business", ("Min Time in Business",), "0", _safe_int),
+    ("max_monthly_nsfs", ("Max Monthly NSFs",), "999", _safe_int),
+    ("max_negative_days", ("Max Negative Days",), "999", _safe_int),
+    ("min_days_since_last_funding", ("Min Days Since Last Funding",), "0", _safe_int),
+    ("max_positions_allowed", ("Max Positions Allowed",), "99", _safe_int),
+    ("min_ownership_percent", ("Min Ownership %",), "0", _safe_float),
+    ("min_monthly_deposits", ("Min Monthly Deposits",), "0", _safe_float),
+    ("min_avg_ledger_balance", ("Min Avg Ledger Balance",), "0", _safe_float),
+    # Backwards compat: also check legacy column names
+    ("min_avg_daily_balance", ("Min Avg Ledger Balance", "Min Avg Daily Balance"), "0", _safe_float),
+    ("max_holdback_percent", ("Max Remit Holdback %", "Max Holdback %"), "100", _safe_float),
+
+    # ── Funding Limits ──
+    ("min_funding_amount", ("Min Funding Amount",), "0", _safe_float),
+    ("max_funding_amount", ("Max Funding Amount",), "0", _safe_float),
+    ("max_daily_ach", ("Max Daily ACH",), "0", _safe_float),
+
+    # ── Restrictions ──
+    ("restricted_states", ("Restricted States",), "", _parse_code_set),
+    ("restricted_industries", ("Restricted Industries",), "", _parse_list),
+    ("preferred_industries", ("Preferred Industries",), "", _parse_list),
+
+    # ── Policies ──
+    ("funds_defaults", ("Funds Defaults",), "", _parse_category),
+    ("non_usa_citizen_policy", ("Non-USA Citizen Policy",), "", _parse_category),
+    ("tax_liens_accepted", ("Tax Liens Accepted",), "", _parse_category),
+    ("tax_liens_notes", ("Tax Liens Notes",), "", str.strip),
+
+    # ── Terms ──
+    ("term_range", ("Term Range",), "", str.strip),
+    ("buy_rates", ("Buy Rates",), "", str.strip),
+    ("buyout_net_rule", ("Buyout/Net Rule",), "", str.strip),
+    ("commission_structure", ("Commission Structure",), "", str.strip),
+    ("renewal_terms", ("Renewal Terms",), "", str.strip),
+
+    # ── Operations ──
+    ("credit_pull_type", ("Credit Pull Type",), "", _parse_category),
+    ("uw_fees", ("UW Fees",), "", str.strip),
+    ("ach_wire", ("ACH/Wire",), "", _parse_category),
+    ("funding_cutoff", ("Funding Cutoff",), "", str.strip),
+    ("bank_login_methods", ("Bank Login Methods",), "", _parse_pipe_list),
+    ("ucc_filing", ("UCC Filing",), "", _parse_category),
+    ("financials_threshold", ("Financials Threshold",), "", str.strip),
+
+    # ── Business Rules ──
+    ("exclusivity_days", ("Exclusivity Days",), "0", _safe_int),
+    ("commission_payout_timeframe", ("Commission Payout Timeframe",), "", str.strip),
+    ("has_renewal_program", ("Has Renewal Program",), "", _parse_bool),
+    ("renewal_eligible_at_percent", ("Renewal Eligible at %",), "0", _safe_float),
+    ("has_stacking_program", ("Has Stacking Program",), "", _parse_bool),
+    ("current_appetite", ("Current Appetite",), "NORMAL", _parse_upper),
+    ("tier", ("Tier",), "", _parse_upper),
+    ("is_active", ("Is Active",), "True", _parse_bool),
+    ("is_preferred", ("Is Preferred",), "", _parse_bool),
+)
+
+_KNOWN_COLUMNS = frozenset(name for _, names, _, _ in _LENDER_COLUMNS for name in names)
+_LIST_PARSERS = (_parse_list, _parse_pipe_list)
 
 
 # ── Default Lenders & Backward-Compatible Wrapper ────────────────────
@@ -466,68 +1052,92 @@ def _get_default_lenders():
     ]
 
 
-def _score_applicant(applicant: dict, lender: dict) -> int:
-    """Score an applicant against a default lender. Returns 0 (disqualified) or 1-100."""
+class _DefaultLenderCriteria(NamedTuple):
+    """The criteria _score_default_lenders() reads from one default lender."""
+    name: str
+    min_rev: float
+    max_nsf: int
+    max_positions: int
+    min_credit: int
+    max_neg_days: int
+
+
+# The default lenders as flat criteria rows, built once at import
+_DEFAULT_LENDER_ROWS = tuple(
+    _DefaultLenderCriteria(
+        name=lender['name'],
+        min_rev=lender['min_monthly_revenue'],
+        max_nsf=lender['max_nsf'],
+        max_positions=lender['max_positions'],
+        min_credit=lender['min_credit_score'],
+        max_neg_days=lender['max_negative_days'],
+    )
+    for lender in _get_default_lenders()
+)
+
+
+def _score_default_lenders(applicant: dict) -> list:
+    """
+    Score an applicant against every default lender.
+    Returns (lender name, score) pairs; score is 0 (disqualified) or 1-100.
+    """
     revenue = applicant.get('monthly_revenue', 0)
     nsf_count = applicant.get('nsf_count', 0)
     positions = applicant.get('existing_positions', applicant.get('position_count', 0))
     credit_score = applicant.get('credit_score', applicant.get('fico_score', 0))
     negative_days = applicant.get('negative_days', 0)
 
-    if revenue < lender['min_monthly_revenue']:
-        return 0
-    if nsf_count > lender['max_nsf']:
-        return 0
-    if positions > lender['max_positions']:
-        return 0
-    if credit_score > 0 and credit_score < lender['min_credit_score']:
-        return 0
-    if negative_days > lender['max_negative_days']:
-        return 0
+    # Applicant-only bonuses are the same for every lender
+    no_negative_days = negative_days == 0
+    no_positions = positions == 0
 
-    score = 50
+    scores = []
+    for name, min_rev, max_nsf, max_positions, min_credit, max_neg_days in _DEFAULT_LENDER_ROWS:
+        if (revenue < min_rev or nsf_count > max_nsf or positions > max_positions
+                or 0 < credit_score < min_credit or negative_days > max_neg_days):
+            scores.append((name, 0))
+            continue
 
-    if lender['min_monthly_revenue'] > 0:
-        rev_ratio = revenue / lender['min_monthly_revenue']
-        if rev_ratio >= 2.0:
-            score += 15
-        elif rev_ratio >= 1.5:
-            score += 10
-        elif rev_ratio >= 1.2:
-            score += 5
+        score = 50
 
-    if lender['max_nsf'] > 0:
-        nsf_remaining = lender['max_nsf'] - nsf_count
-        score += min(10, nsf_remaining * 3)
+        if min_rev > 0:
+            rev_ratio = revenue / min_rev
+            if rev_ratio >= 2.0:
+                score += 15
+            elif rev_ratio >= 1.5:
+                score += 10
+            elif rev_ratio >= 1.2:
+                score += 5
 
-    if credit_score > 0 and lender['min_credit_score'] > 0:
-        credit_diff = credit_score - lender['min_credit_score']
-        if credit_diff >= 100:
-            score += 10
-        elif credit_diff >= 50:
-            score += 5
+        if max_nsf > 0:
+            score += min(10, (max_nsf - nsf_count) * 3)
+
+        if credit_score > 0 and min_credit > 0:
+            credit_diff = credit_score - min_credit
+            if credit_diff >= 100:
+                score += 10
+            elif credit_diff >= 50:
+                score += 5
 
-    if negative_days == 0:
-        score += 5
-    if positions == 0:
-        score += 5
+        if no_negative_days:
+            score += 5
+        if no_positions:
+            score += 5
 
-    return max(0, min(100, score))
+        scores.append((name, max(0, min(100, score))))
+    return scores
 
 
 def find_matching_lenders(applicant_profile):
     """Backward-compatible wrapper. Uses default lender criteria when no CSV path provided."""
-    import os
-    csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'input_config', 'lender_template.csv')
-    if not os.path.exists(csv_path):
-        lenders = _get_default_lenders()
+    if not os.path.exists(_DEFAULT_LENDER_CSV):
+        scores = _score_default_lenders(applicant_profile)
         eligible = []
         disqualified = []
-        for lender in lenders:
-            score = _score_applicant(applicant_profile, lender)
+        for name, score in scores:
             entry = {
-                'lender_name': lender['name'],
-                'display_name': lender['name'],
+                'lender_name': name,
+                'display_name': name,
                 'match_score': score,
                 'eligible': score > 0,
             }
@@ -541,7 +1151,7 @@ def find_matching_lenders(applicant_profile):
             'disqualified': disqualified,
             'summary': {
                 'eligible_count': len(eligible),
-                'total_lenders_checked': len(lenders),
+                'total_lenders_checked': len(scores),
             }
         }
-    return match_lenders(applicant_profile, csv_path)
+    return match_lenders(applicant_profile, _DEFAULT_LENDER_CSV)
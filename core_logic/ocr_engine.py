@@ -9,8 +9,15 @@ Strategy:
 """
 
 import pdfplumber
+import hashlib
+import json
+import multiprocessing
 import re
-from typing import List, Dict, Optional, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 import os
@@ -32,6 +39,18 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
+try:
+    from tesserocr import PyTessBaseAPI
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 
 BANK_PATTERNS = {
     'pnc': [r'PNC Bank', r'PNC BANK', r'pnc\.com'],
@@ -63,6 +82,162 @@ DATE_PATTERNS = [
 
 AMOUNT_PATTERN = r'[\$]?\s*[\-\(]?\s*[\d,]+\.?\d{0,2}\s*[\)]?'
 
+TABLE_TEXT_THRESHOLD = 100
+
+# Editing software that should not appear in a bank-issued PDF's metadata
+FRAUD_TOOLS = ["PHOTOSHOP", "ADOBE PHOTOSHOP", "CANVA", "GIMP", "PIXLR",
+               "ILLUSTRATOR", "INKSCAPE", "AFFINITY"]
+
+# Scanned pages are rendered at OCR_DPI for OCR. Callers can pass
+# dpi=OCR_FAST_DPI to extract_text_ocr() for about 2.25x fewer pixels per
+# page; a statement that yields (almost) no text at a reduced resolution is
+# read again at OCR_DPI.
+OCR_DPI = 300
+OCR_FAST_DPI = 200
+
+# PDFs with at least this many pages have their pages extracted across
+# worker processes
+_PARALLEL_MIN_PAGES = 10
+
+# Parsed statements are cached here as JSON, keyed by a hash of the PDF bytes.
+# Bump _STATEMENT_CACHE_VERSION whenever parsing output changes.
+_STATEMENT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'processed_data', 'statement_cache'
+)
+_STATEMENT_CACHE_VERSION = 2
+# Cached statements hold account numbers and transactions, so entries expire
+# after this many days; purge_statement_cache() deletes them.
+_STATEMENT_CACHE_MAX_AGE_DAYS = 30
+
+# PDF digests by absolute path: (mtime_ns, size) -> digest, so an unchanged
+# file is not re-hashed.
+_DIGEST_CACHE: Dict[str, tuple] = {}
+
+# ── Compiled patterns ───────────────────────────────────────────────────────
+# Built once at import so the per-line parsers skip the re module's cache
+# lookup on every call.
+
+_BANK_REGEX = {
+    bank: re.compile('|'.join(patterns), re.IGNORECASE)
+    for bank, patterns in BANK_PATTERNS.items()
+}
+# Every bank pattern opens with a literal letter; the lookahead on that set
+# lets the scanner skip most positions before trying the alternation.
+_BANK_LEADS = ''.join(sorted({re.escape(p[0]) for pats in BANK_PATTERNS.values() for p in pats}))
+_BANK_DETECT_RE = re.compile(
+    f'(?=[{_BANK_LEADS}])(?:'
+    + '|'.join(f'(?P<{bank}>{"|".join(patterns)})' for bank, patterns in BANK_PATTERNS.items())
+    + ')',
+    re.IGNORECASE,
+)
+_BANK_ORDER = list(BANK_PATTERNS)
+_BANK_RANK = {bank: i for i, bank in enumerate(_BANK_ORDER)}
+_DATE_REGEXES = [re.compile(p) for p in DATE_PATTERNS]
+# Matches exactly when some DATE_PATTERNS regex does; the digit-led forms
+# share one branch so most positions are rejected on a single character.
+_ANY_DATE_RE = re.compile(
+    r'\d(?:\d?/\d{1,2}/\d{2,4}|\d?-\d{1,2}-\d{2,4}|\d{3}-\d{2}-\d{2}|\d?\s+[A-Za-z]{3}\s+\d{4})'
+    r'|[A-Za-z]{3}\s+\d{1,2},?\s+\d{4}'
+)
+_AMOUNT_RE = re.compile(r'[\$]?\s*[\-\(]?\s*[\d,]+\.\d{2}\s*[\)]?')
+_CENTS_RE = re.compile(r'[\d,]\.\d{2}')
+_CENTS_BYTES_RE = re.compile(_CENTS_RE.pattern.encode('ascii'))
+_NUMERIC_CELL_RE = re.compile(r'^[\d\.\$\-\(\),\s]+$')
+# The ASCII characters _NUMERIC_CELL_RE accepts, for _is_numeric_cell()
+_NUMERIC_CELL_CHARS = ''.join(c for c in map(chr, range(128)) if _NUMERIC_CELL_RE.match(c))
+_TRAILING_AMOUNT_RE = re.compile(r'\s+[\d,]+\.\d{2}\s*$')
+_LEADING_NUMBER_RE = re.compile(r'^\d+\s+')
+_CHASE_SECTION_RE = re.compile(
+    r'TRANSACTION DETAIL|CHECKING SUMMARY|DEPOSITS AND ADDITIONS|WITHDRAWALS', re.IGNORECASE
+)
+_CHASE_LINE_RE = re.compile(r'^(\d{2}/\d{2})\s+(.+?)\s+([\-]?[\d,]+\.\d{2})(?:\s+([\d,]+\.\d{2}))?')
+
+_ACCOUNT_NUMBER_REGEXES = [
+    re.compile(r'Account\s*(?:Number|#|No\.?)?\s*[:\s]*[\*xX]*(\d{4,})', re.IGNORECASE),
+    re.compile(r'(?:Account|Acct)\s*[:\s]*[\*xX]+(\d{4})', re.IGNORECASE),
+    re.compile(r'ending\s+in\s+(\d{4})', re.IGNORECASE),
+]
+# These run over the whole statement and usually miss. A case-insensitive
+# pattern that opens with an alternation gets no prefix scan from the re
+# engine, so the (case-sensitive) lookahead on its possible first letters
+# does that job; 'ſ' is the one non-ASCII letter IGNORECASE matches to them.
+_PERIOD_REGEXES = [
+    re.compile(r'(?=[SsſPp])(?i:(?:Statement\s+Period|Period)[:\s]*(\w+\s+\d{1,2},?\s+\d{4})\s*(?:to|through|-)\s*(\w+\s+\d{1,2},?\s+\d{4}))'),
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})\s*(?:to|through|-)\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
+]
+_BALANCE_REGEXES = [
+    (re.compile(r'(?=[BbOoPp])(?i:(?:Beginning|Opening|Previous)\s+Balance[:\s]*\$?([\d,]+\.\d{2}))'), 'opening_balance'),
+    (re.compile(r'(?=[EeCcNn])(?i:(?:Ending|Closing|New)\s+Balance[:\s]*\$?([\d,]+\.\d{2}))'), 'closing_balance'),
+]
+# The business address is printed in the statement header
+_ADDRESS_SCAN_CHARS = 2000
+_ADDRESS_REGEXES = [
+    re.compile(r'(?:Address|Mailing)[:\s]*([\w\s]+\n[\w\s,]+\s+\d{5}(?:-\d{4})?)'),
+    re.compile(r'(\d+\s+[\w\s]+(?:St|Ave|Blvd|Rd|Dr|Ln|Way|Ct|Pl)\.?[,\s]+[\w\s]+,?\s*[A-Z]{2}\s+\d{5})'),
+]
+_WHITESPACE_RE = re.compile(r'\s+')
+_FRAUD_TOOL_RE = re.compile('|'.join(map(re.escape, FRAUD_TOOLS)))
+# Keyword alternations, matched against upper-cased descriptions and rows
+_DEPOSIT_INDICATOR_RE = re.compile(
+    r'DEPOSIT|CREDIT|WIRE IN|ACH CREDIT|DIRECT DEP|MOBILE DEP|INTEREST EARNED|REFUND'
+)
+_WITHDRAWAL_INDICATOR_RE = re.compile(
+    r'DEBIT|WITHDRAWAL|CHECK|FEE|CHARGE|WIRE OUT|ACH DEBIT|PAYMENT|PURCHASE'
+)
+_TABLE_HEADER_RE = re.compile(r'DATE|DESCRIPTION|AMOUNT|BALANCE|DEBIT|CREDIT|DEPOSITS|WITHDRAWALS')
+_TRAILING_NUMBER_RE = re.compile(r'\s+\d+\s*$')
+
+_TRUIST_PERIOD_RE = re.compile(r'(?:as of|For)\s*(\d{2}/\d{2}/\d{4})')
+_TRUIST_END_RE = re.compile(r'new balance as of\s*(\d{2}/\d{2}/\d{4})')
+_TRUIST_ACCOUNT_LINE_RE = re.compile(r'^\d{10,}$')
+_TRUIST_MAV_RE = re.compile(r'^\d{3}\d+MAV$')
+_TRUIST_FOOTER_RE = re.compile(r'^(FL|Page)\s')
+# Every Truist line that can open a section or hold a transaction contains one
+# of these (in upper case); the section words may be broken up by spaces
+_TRUIST_CANDIDATE_RE = re.compile(r'\d{2}/\d{2}|CHECKS|DEBITS|O *T *H *E *R|D *E *P *O *S *I *T *S')
+_TRUIST_CHECK_ENTRY_RE = re.compile(r'(\d{2}/\d{2})\s+(\d+)\s+([\d,]+\.\d{2})')
+_TRUIST_LINE_RE = re.compile(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s*$')
+
+_PNC_PERIOD_RE = re.compile(r'Period\s+(\d{2}/\d{2}/\d{4})\s+to\s+(\d{2}/\d{2}/\d{4})')
+# Header, footer and boilerplate lines. Most open the line, so they are
+# tried as one alternation anchored at its start; a search over the whole
+# line is only needed for the three that can appear anywhere.
+_PNC_SKIP_PREFIX_RE = re.compile('|'.join([
+    r'Date\s+Transaction\s+Reference',
+    r'posted\s+Amount\s+description',
+    r'Date\s+Check\s+Reference',
+    r'posted\s+number\s+Amount',
+    r'Business Checking',
+    r'For 24-hour',
+    r'pnc\.com',
+    r'Primary Account Number',
+    r'Page \d+ of \d+',
+    r'Effective \d{2}-\d{2}',
+    r'\d{3}-\d{7}',
+    r'[A-Z]{3}\s+\w.{0,40}Mav$',
+    r'Payoneer\s',
+    r'ADP\s',
+    r'Detail of Services',
+    r'Note:',
+    r'\*\* Combined',
+    r'Description\s+Volume\s+Amount',
+    r'Monthly',
+    r'Total',
+    r'Member FDIC',
+]), re.IGNORECASE)
+_PNC_SKIP_ANYWHERE_RE = re.compile(
+    r'continued on next page|\(cid:\d+\)|Gap in check sequence', re.IGNORECASE
+)
+# Every PNC line that can open a section or hold a transaction contains one of
+# these (in upper case); the rest are skipped without running the line logic
+_PNC_CANDIDATE_RE = re.compile(
+    r'\d{2}/\d{2}|DAILY BALANCE|DEPOSITS|ADDITIONS|CHECKS|DEBIT CARD PURCHASE|POS PURCHASE|ATM'
+    r'|ACH DEDUCTION|SERVICE CHARGE|OTHER DEDUCTION|ACTIVITY DETAIL|BALANCE SUMMARY|OVERDRAFT'
+    r'|DETAIL OF SERVICES'
+)
+_PNC_CHECK_ENTRY_RE = re.compile(r'(\d{2}/\d{2})\s+(\d+\s*\*?\s*)\s+([\d,]+\.\d{2})\s+(\d+)')
+_PNC_LINE_RE = re.compile(r'^(\d{2}/\d{2})\s+([\d,]+\.\d{2})([-]?)\s+(.+)')
+
 
 def _safe_parse_date(date_str: str) -> Optional[str]:
     """Parse a date string into YYYY-MM-DD format, returning None on failure."""
@@ -111,41 +286,30 @@ def _parse_amount(amount_str: str) -> float:
 
 
 def _extract_address(text: str) -> Optional[str]:
-    """Try to extract a business address from the statement header."""
-    patterns = [
-        r'(?:Address|Mailing)[:\s]*([\w\s]+\n[\w\s,]+\s+\d{5}(?:-\d{4})?)',
-        r'(\d+\s+[\w\s]+(?:St|Ave|Blvd|Rd|Dr|Ln|Way|Ct|Pl)\.?[,\s]+[\w\s]+,?\s*[A-Z]{2}\s+\d{5})',
-    ]
-    for pat in patterns:
-        match = re.search(pat, text)
+    """
+    Try to extract a business address from the statement header (the first
+    _ADDRESS_SCAN_CHARS characters). Bounding the search keeps the street
+    pattern's backtracking off the transaction pages.
+    """
+    for regex in _ADDRESS_REGEXES:
+        match = regex.search(text, 0, _ADDRESS_SCAN_CHARS)
         if match:
             addr = match.group(1).strip()
-            addr = re.sub(r'\s+', ' ', addr)
+            addr = _WHITESPACE_RE.sub(' ', addr)
             return addr
     return None
 
 
 def _infer_transaction_signs(transactions: list, opening_balance: float, text: str) -> list:
     """If amounts lack sign info, try to infer from descriptions and balance."""
-    deposit_indicators = [
-        "DEPOSIT", "CREDIT", "WIRE IN", "ACH CREDIT", "DIRECT DEP",
-        "MOBILE DEP", "INTEREST EARNED", "REFUND",
-    ]
-    withdrawal_indicators = [
-        "DEBIT", "WITHDRAWAL", "CHECK", "FEE", "CHARGE",
-        "WIRE OUT", "ACH DEBIT", "PAYMENT", "PURCHASE",
-    ]
-
     all_positive = all(t["amount"] >= 0 for t in transactions if t["amount"] != 0)
     if not all_positive:
         return transactions
 
     for txn in transactions:
         desc_upper = txn["description"].upper()
-        is_deposit = any(ind in desc_upper for ind in deposit_indicators)
-        is_withdrawal = any(ind in desc_upper for ind in withdrawal_indicators)
-
-        if is_withdrawal and not is_deposit and txn["amount"] > 0:
+        if (txn["amount"] > 0 and _WITHDRAWAL_INDICATOR_RE.search(desc_upper)
+                and not _DEPOSIT_INDICATOR_RE.search(desc_upper)):
             txn["amount"] = -txn["amount"]
 
     return transactions
@@ -160,36 +324,138 @@ def _assign_running_balances(transactions: list, opening_balance: float) -> list
     if opening_balance == 0.0:
         return transactions
 
-    running = opening_balance
-    for txn in transactions:
-        running += txn["amount"]
+    balances = accumulate([txn["amount"] for txn in transactions], initial=opening_balance)
+    next(balances)  # the opening balance itself
+    for txn, running in zip(transactions, balances):
         txn["running_balance"] = round(running, 2)
     return transactions
 
 
-def extract_text_from_pdf(pdf_path: str) -> Tuple[str, List[List]]:
+def _page_content(page, table_text_threshold: Optional[int]) -> Tuple[Optional[str], List]:
+    """
+    Extract one page's text, plus its tables unless the text is long enough to
+    skip them. The page's cached layout objects are released afterwards, so a
+    long PDF does not hold every parsed page in memory at once.
+    """
+    try:
+        text = page.extract_text()
+        if text and table_text_threshold is not None and len(text) >= table_text_threshold:
+            return text, []
+        return text, page.extract_tables()
+    finally:
+        page.close()
+
+
+def _collect_table_rows(page_tables: List, rows: List, text_parts: List[str]) -> None:
+    """Append each non-empty table row to rows, and its ' | '-joined cells to text_parts."""
+    for table in page_tables:
+        if not table:
+            continue
+        for row in table:
+            if row:
+                rows.append(row)
+                text_parts.append(' | '.join([str(cell) if cell else '' for cell in row]))
+
+
+@lru_cache(maxsize=None)
+def _pool_context():
+    """
+    Multiprocessing context for the page and statement pools, resolved on
+    first use. Workers come from a fork server rather than a fork() of this
+    process, which is unsafe once the host has started threads (OCR
+    threads, the Flask app); platforms without a fork server use "spawn".
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int,
+                        table_text_threshold: Optional[int]) -> List[Tuple[Optional[str], List]]:
+    """Worker: open the PDF and extract pages [start, stop)."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_page_content(page, table_text_threshold) for page in pdf.pages[start:stop]]
+
+
+def _iter_page_content(pdf, pdf_path: str, table_text_threshold: Optional[int] = None,
+                       parallel: bool = True):
+    """
+    Yield (text, tables) for each page of an open PDF, in page order.
+    Long PDFs are split into contiguous page ranges across worker processes
+    (unless parallel is False); pdfplumber pages share one parser and file
+    handle, so each worker opens its own copy of the file.
+    """
+    n = len(pdf.pages)
+    workers = min(os.cpu_count() or 1, n) if parallel else 1
+    if n < _PARALLEL_MIN_PAGES or workers < 2:
+        for page in pdf.pages:
+            yield _page_content(page, table_text_threshold)
+        return
+
+    bounds = [n * i // workers for i in range(workers + 1)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        for part in pool.map(_extract_page_range, repeat(pdf_path), bounds[:-1], bounds[1:],
+                             repeat(table_text_threshold)):
+            yield from part
+
+
+def _iter_text_page_content(pdf_path: str, use_pdfium: bool = False):
+    """
+    Yield (text, tables) per page for extract_text_from_pdf(). With
+    use_pdfium (and pypdfium2 installed) PDFium's native text layer is used,
+    skipping pdfminer's pure-Python layout analysis; only thin, scan-like
+    pages are then handed to pdfplumber, which also pulls their tables.
+    """
+    if not (use_pdfium and PDFIUM_AVAILABLE):
+        with pdfplumber.open(pdf_path) as pdf:
+            yield from _iter_page_content(pdf, pdf_path, TABLE_TEXT_THRESHOLD)
+        return
+
+    texts = _pdfium_page_texts(pdf_path)
+    thin = [i for i, text in enumerate(texts) if len(text) < TABLE_TEXT_THRESHOLD]
+    fallback = {}
+    if thin:
+        with pdfplumber.open(pdf_path) as pdf:
+            for i in thin:
+                fallback[i] = _page_content(pdf.pages[i], TABLE_TEXT_THRESHOLD)
+    for i, text in enumerate(texts):
+        yield fallback.get(i, (text, []))
+
+
+def _pdfium_page_texts(pdf_path: str) -> List[str]:
+    """Extract each page's text layer with PDFium, with pdfplumber-style line endings."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range().replace('\r\n', '\n'))
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        pdf.close()
+
+
+def extract_text_from_pdf(pdf_path: str, use_pdfium: bool = False) -> Tuple[str, List[List]]:
     """
     Extract raw text and table data from a PDF bank statement using pdfplumber.
     Returns tuple of (full_text, all_tables).
+    use_pdfium=True reads the text layer with PDFium instead (much faster when
+    pypdfium2 is installed), but it orders and spaces text differently from
+    pdfplumber and the bank parsers find fewer transactions in it.
+    Tables are only pulled (with pdfplumber) from pages whose text layer is
+    thinner than TABLE_TEXT_THRESHOLD characters; the table pass is a second
+    full layout analysis and adds nothing on pages that already have usable text.
     """
     full_text = []
     all_tables = []
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    full_text.append(text)
-                
-                tables = page.extract_tables()
-                for table in tables:
-                    if table:
-                        all_tables.extend([row for row in table if row])
-                        for row in table:
-                            if row:
-                                row_text = ' | '.join([str(cell) if cell else '' for cell in row])
-                                full_text.append(row_text)
+        for text, tables in _iter_text_page_content(pdf_path, use_pdfium):
+            if text:
+                full_text.append(text)
+            _collect_table_rows(tables, all_tables, full_text)
     except Exception as e:
         print(f"Error extracting PDF text: {e}")
         return "", []
@@ -197,37 +463,78 @@ def extract_text_from_pdf(pdf_path: str) -> Tuple[str, List[List]]:
     return '\n'.join(full_text), all_tables
 
 
-def extract_text_ocr(pdf_path: str) -> str:
-    """Extract text using pytesseract OCR (for scanned/image-based PDFs)."""
+def extract_text_ocr(pdf_path: str, dpi: int = OCR_DPI, parallel: bool = True) -> str:
+    """
+    Extract text using pytesseract OCR (for scanned/image-based PDFs).
+    Pages are OCR'd concurrently at OCR_DPI (one at a time if parallel is
+    False); pass dpi=OCR_FAST_DPI to trade some accuracy for speed, or a
+    higher dpi for poor-quality scans.
+    """
     if not OCR_AVAILABLE:
         return ""
     try:
-        images = convert_from_path(pdf_path, dpi=300)
-        text_parts = []
-        for image in images:
-            page_text = pytesseract.image_to_string(image)
-            if page_text:
-                text_parts.append(page_text)
-        return "\n".join(text_parts)
+        images = convert_from_path(pdf_path, dpi=dpi)
+        text_parts = [page_text for page_text in _ocr_pages(images, parallel) if page_text]
+        text = "\n".join(text_parts)
     except Exception:
         return ""
+    if dpi < OCR_DPI and len(text.strip()) <= TABLE_TEXT_THRESHOLD:
+        return extract_text_ocr(pdf_path, OCR_DPI, parallel)
+    return text
+
+
+def _ocr_pages(images: List, parallel: bool = True) -> List[str]:
+    """
+    OCR page images in order, splitting them into contiguous runs across
+    threads. Tesseract does its work outside the GIL (in its own process
+    for pytesseract, in C for tesserocr), so threads run it in parallel
+    without pickling the page images to worker processes.
+    """
+    workers = min(os.cpu_count() or 1, len(images)) if parallel else 1
+    if workers < 2:
+        return _ocr_images(images)
+    bounds = [len(images) * i // workers for i in range(workers + 1)]
+    runs = [images[start:stop] for start, stop in zip(bounds, bounds[1:])]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [text for run in pool.map(_ocr_images, runs) for text in run]
+
+
+def _ocr_images(images: List) -> List[str]:
+    """
+    OCR page images in order. With tesserocr installed, one engine instance
+    reads every page; pytesseract starts a tesseract process (and reloads the
+    language data) per page, so it is only the fallback.
+    """
+    if TESSEROCR_AVAILABLE:
+        try:
+            with PyTessBaseAPI() as api:
+                texts = []
+                for image in images:
+                    api.SetImage(image)
+                    texts.append(api.GetUTF8Text())
+                return texts
+        except RuntimeError:
+            # tesserocr could not initialize (e.g. no tessdata); use the CLI
+            pass
+    return [pytesseract.image_to_string(image) for image in images]
 
 
 def check_pdf_metadata(pdf) -> list:
     """Check PDF creator/producer fields for editing software."""
     flags = []
     metadata = pdf.metadata or {}
-    fraud_tools = ["PHOTOSHOP", "ADOBE PHOTOSHOP", "CANVA", "GIMP", "PIXLR",
-                   "ILLUSTRATOR", "INKSCAPE", "AFFINITY"]
 
     creator = str(metadata.get("Creator", "")).upper()
     producer = str(metadata.get("Producer", "")).upper()
 
-    for tool in fraud_tools:
-        if tool in creator:
-            flags.append(f"FRAUD WARNING: PDF Creator field contains '{tool}' — possible statement manipulation")
-        if tool in producer:
-            flags.append(f"FRAUD WARNING: PDF Producer field contains '{tool}' — possible statement manipulation")
+    # One scan clears the usual clean file; on a hit, every tool is reported
+    # per field (a Photoshop file names both PHOTOSHOP and ADOBE PHOTOSHOP)
+    if _FRAUD_TOOL_RE.search(creator) or _FRAUD_TOOL_RE.search(producer):
+        for tool in FRAUD_TOOLS:
+            if tool in creator:
+                flags.append(f"FRAUD WARNING: PDF Creator field contains '{tool}' — possible statement manipulation")
+            if tool in producer:
+                flags.append(f"FRAUD WARNING: PDF Producer field contains '{tool}' — possible statement manipulation")
 
     mod_date = metadata.get("ModDate", "")
     create_date = metadata.get("CreationDate", "")
@@ -270,42 +577,48 @@ def detect_bank_format(text: str) -> str:
     Letterhead gets priority to avoid false matches from transaction
     descriptions that mention other banks (e.g., wire transfers via BofA).
     """
-    letterhead = text[:500]
-    for bank, patterns in BANK_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, letterhead, re.IGNORECASE):
-                return bank
-
-    header_text = text[:1500]
-    for bank, patterns in BANK_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, header_text, re.IGNORECASE):
-                return bank
-
-    for bank, patterns in BANK_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return bank
+    scanned = -1
+    for size in (500, 1500, len(text)):
+        size = min(size, len(text))
+        # A text shorter than the last window has already been scanned whole
+        if size == scanned:
+            break
+        bank = _first_bank_in(text, size)
+        if bank:
+            return bank
+        scanned = size
 
     return 'unknown'
 
 
+def _first_bank_in(text: str, endpos: int) -> Optional[str]:
+    """
+    Return the highest-priority bank named anywhere in text[:endpos], or None.
+    The window is bounded with endpos rather than sliced out.
+    """
+    match = _BANK_DETECT_RE.search(text, 0, endpos)
+    if not match:
+        return None
+    found = match.lastgroup
+    # The leftmost hit wins the scan, but BANK_PATTERNS order decides ties, so
+    # only the banks listed ahead of it need a second look.
+    for bank in _BANK_ORDER[:_BANK_RANK[found]]:
+        if _BANK_REGEX[bank].search(text, 0, endpos):
+            return bank
+    return found
+
+
 def parse_date(date_str: str) -> Optional[datetime]:
     """
     Parse various date formats into datetime object.
+    Results are memoized, as statements repeat the same dates many times.
     """
-    date_formats = [
-        '%m/%d/%Y', '%m/%d/%y',
-        '%m-%d-%Y', '%m-%d-%y',
-        '%Y-%m-%d',
-        '%b %d, %Y', '%b %d %Y',
-        '%d %b %Y',
-        '%B %d, %Y',
-    ]
-    
-    date_str = date_str.strip()
-    
-    for fmt in date_formats:
+    return _parse_stripped_date(date_str.strip())
+
+
+@lru_cache(maxsize=8192)
+def _parse_stripped_date(date_str: str) -> Optional[datetime]:
+    for fmt in _date_formats_for(date_str):
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -314,6 +627,48 @@ def parse_date(date_str: str) -> Optional[datetime]:
     return None
 
 
+def _parse_mmdd(mmdd: str, year: int) -> Optional[datetime]:
+    """
+    parse_date(f"{mmdd}/{year}") for a year-less MM/DD string, building the
+    datetime directly rather than formatting a string for strptime.
+    """
+    if year < 1000 or not mmdd.isascii():
+        # Non-ASCII digits and short years are left to strptime's rules
+        return parse_date(f"{mmdd}/{year}")
+    month, _, day = mmdd.partition('/')
+    try:
+        return datetime(year, int(month), int(day))
+    except ValueError:
+        return None
+
+
+# Candidate formats for parse_date(), keyed by the length of the trailing
+# year field after the last separator.
+_SLASH_DATE_FORMATS = {4: ('%m/%d/%Y',), 2: ('%m/%d/%y',)}
+_DASH_DATE_FORMATS = {4: ('%m-%d-%Y',), 2: ('%m-%d-%y',)}
+
+
+def _date_formats_for(date_str: str) -> Tuple[str, ...]:
+    """
+    Pick the only formats that could fit date_str from its shape (separator,
+    year width, leading digit, comma), so parse_date() no longer walks all
+    nine formats raising ValueError on each miss.
+    """
+    if '/' in date_str:
+        return _SLASH_DATE_FORMATS.get(len(date_str) - date_str.rfind('/') - 1, ())
+    if '-' in date_str:
+        if date_str.find('-') == 4:
+            return ('%Y-%m-%d',)
+        return _DASH_DATE_FORMATS.get(len(date_str) - date_str.rfind('-') - 1, ())
+    if not date_str:
+        return ()
+    if date_str[0].isdigit():
+        return ('%d %b %Y',)
+    if ',' in date_str:
+        return ('%b %d, %Y', '%B %d, %Y')
+    return ('%b %d %Y',)
+
+
 def parse_amount(amount_str: str) -> Optional[float]:
     """
     Parse amount string to float, handling various formats.
@@ -323,9 +678,13 @@ def parse_amount(amount_str: str) -> Optional[float]:
     
     amount_str = amount_str.strip()
     
-    is_negative = bool(re.search(r'[\-\(]', amount_str))
+    is_negative = '-' in amount_str or '(' in amount_str
     
-    cleaned = re.sub(r'[\$,\s\(\)\-]', '', amount_str)
+    # Drop currency punctuation and all whitespace. On strings this short,
+    # chained str.replace (which returns the string itself when the character
+    # is absent) beats both a regex sub and str.translate.
+    cleaned = amount_str.replace('$', '').replace(',', '').replace('(', '').replace(')', '').replace('-', '')
+    cleaned = ''.join(cleaned.split())
     
     try:
         amount = float(cleaned)
@@ -336,6 +695,17 @@ def parse_amount(amount_str: str) -> Optional[float]:
         return None
 
 
+def _is_numeric_cell(cell: str) -> bool:
+    """
+    True if cell is made up only of digits, amount punctuation and whitespace
+    (_NUMERIC_CELL_RE). ASCII cells are checked with str.strip, which stops at
+    the first character outside the set without entering the regex engine.
+    """
+    if cell.isascii():
+        return bool(cell) and not cell.strip(_NUMERIC_CELL_CHARS)
+    return _NUMERIC_CELL_RE.match(cell) is not None
+
+
 def extract_transactions_from_tables(tables: List[List]) -> List[Dict]:
     """
     Extract transactions from structured table data.
@@ -349,42 +719,42 @@ def extract_transactions_from_tables(tables: List[List]) -> List[Dict]:
         
         cells = [str(cell).strip() if cell else '' for cell in row]
         
-        if any(header in ' '.join(cells).upper() for header in ['DATE', 'DESCRIPTION', 'AMOUNT', 'BALANCE', 'DEBIT', 'CREDIT', 'DEPOSITS', 'WITHDRAWALS']):
+        row_text = ' '.join(cells)
+        if _TABLE_HEADER_RE.search(row_text.upper()):
+            continue
+        
+        # Any date inside a cell is also in the joined row, so one scan of
+        # the row rejects date-free rows before the per-cell searches
+        if not _ANY_DATE_RE.search(row_text):
             continue
         
         date_val = None
         date_idx = -1
         for i, cell in enumerate(cells):
-            for date_pattern in DATE_PATTERNS:
-                match = re.search(date_pattern, cell)
-                if match:
-                    date_val = parse_date(match.group(1))
-                    if date_val:
-                        date_idx = i
-                        break
+            for match in _date_matches(cell):
+                date_val = parse_date(match.group(1))
+                if date_val:
+                    date_idx = i
+                    break
             if date_val:
                 break
         
         if not date_val:
             continue
         
+        # Classify every other cell in one pass: an amount, or else a
+        # candidate description part
         amounts = []
-        amount_indices = []
+        description_parts = []
         for i, cell in enumerate(cells):
             if i == date_idx:
                 continue
-            amt_match = re.search(r'[\$]?\s*[\-\(]?\s*([\d,]+\.\d{2})\s*[\)]?', cell)
-            if amt_match:
+            if _AMOUNT_RE.search(cell):
                 parsed_amt = parse_amount(cell)
                 if parsed_amt is not None:
                     amounts.append((i, cell, parsed_amt))
-                    amount_indices.append(i)
-        
-        description_parts = []
-        for i, cell in enumerate(cells):
-            if i == date_idx or i in amount_indices:
-                continue
-            if cell and len(cell) > 1 and not re.match(r'^[\d\.\$\-\(\),\s]+$', cell):
+                    continue
+            if len(cell) > 1 and not _is_numeric_cell(cell):
                 description_parts.append(cell)
         
         description = ' '.join(description_parts).strip()
@@ -392,7 +762,7 @@ def extract_transactions_from_tables(tables: List[List]) -> List[Dict]:
         if not description:
             for i, cell in enumerate(cells):
                 if i != date_idx and cell and len(cell) > 3:
-                    if not re.match(r'^[\d\.\$\-\(\),\s]+$', cell):
+                    if not _is_numeric_cell(cell):
                         description = cell
                         break
         
@@ -423,6 +793,71 @@ def extract_transactions_from_tables(tables: List[List]) -> List[Dict]:
     return transactions
 
 
+def _date_matches(text: str):
+    """
+    Yield each DATE_PATTERNS regex's first match in text, in pattern order.
+    One scan with the combined pattern rejects date-free text before the
+    per-pattern searches run.
+    """
+    if not _ANY_DATE_RE.search(text):
+        return
+    for regex in _DATE_REGEXES:
+        match = regex.search(text)
+        if match:
+            yield match
+
+
+def _amount_lines(text: str):
+    """
+    Yield, in order, only the lines of text that contain a cents amount.
+    A line without one can never produce a transaction, so one finditer
+    over the whole text replaces the date/amount regexes on every line.
+    ASCII text is scanned as bytes, where offsets line up with the str.
+    """
+    if text.isascii():
+        return _matching_lines(text, _CENTS_BYTES_RE.finditer(text.encode('ascii')))
+    return _matching_lines(text, _CENTS_RE.finditer(text))
+
+
+def _candidate_lines(text: str, candidate_re):
+    """
+    Yield (line, upper-cased line) for the lines of text whose upper-cased
+    form matches candidate_re. The text is upper-cased once and scanned with
+    one finditer; when upper-casing changes its length the offsets no longer
+    line up, and every line is yielded instead.
+    """
+    upper_text = text.upper()
+    if len(upper_text) != len(text):
+        yield from zip(text.split('\n'), upper_text.split('\n'))
+        return
+    end = -1
+    for match in candidate_re.finditer(upper_text):
+        if match.start() < end:
+            continue
+        start = text.rfind('\n', 0, match.start()) + 1
+        end = text.find('\n', match.end())
+        if end == -1:
+            end = len(text)
+        yield text[start:end], upper_text[start:end]
+
+
+def _matching_lines(text: str, matches):
+    """
+    Yield, in order and once each, the lines of text holding a match.
+    matches may come from a scan of any stand-in whose offsets line up
+    with text, such as its bytes.
+    """
+    end = -1
+    for match in matches:
+        if match.start() < end:
+            continue
+        start = text.rfind('\n', 0, match.start()) + 1
+        end = text.find('\n', match.end())
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+
+
 def extract_transactions_generic(text: str, tables: List[List] = None) -> List[Dict]:
     """
     Generic transaction extraction for unknown bank formats.
@@ -434,9 +869,8 @@ def extract_transactions_generic(text: str, tables: List[List] = None) -> List[D
             return table_transactions
     
     transactions = []
-    lines = text.split('\n')
     
-    for line in lines:
+    for line in _amount_lines(text):
         line = line.strip()
         if not line or len(line) < 10:
             continue
@@ -452,22 +886,20 @@ def extract_transactions_generic(text: str, tables: List[List] = None) -> List[D
                     continue
                 
                 if not date_val:
-                    for date_pattern in DATE_PATTERNS:
-                        match = re.search(date_pattern, part)
-                        if match:
-                            date_val = parse_date(match.group(1))
-                            break
+                    for match in _date_matches(part):
+                        date_val = parse_date(match.group(1))
+                        break
                     if date_val:
                         continue
                 
-                amt_match = re.search(r'[\$]?\s*[\-\(]?\s*([\d,]+\.\d{2})\s*[\)]?', part)
-                if amt_match and re.match(r'^[\$\d\.\-\(\),\s]+$', part.strip()):
+                amt_match = _AMOUNT_RE.search(part)
+                if amt_match and _is_numeric_cell(part.strip()):
                     parsed_amt = parse_amount(part)
                     if parsed_amt is not None:
                         amounts.append((part, parsed_amt))
                         continue
                 
-                if len(part) > 2 and not re.match(r'^[\d\.\$\-\(\),\s]+$', part):
+                if len(part) > 2 and not _is_numeric_cell(part):
                     description_parts.append(part)
             
             description = ' '.join(description_parts).strip()
@@ -487,46 +919,45 @@ def extract_transactions_generic(text: str, tables: List[List] = None) -> List[D
                 })
                 continue
         
-        for date_pattern in DATE_PATTERNS:
-            date_match = re.search(date_pattern, line)
-            if date_match:
-                date_str = date_match.group(1)
-                parsed_date = parse_date(date_str)
+        for date_match in _date_matches(line):
+            date_str = date_match.group(1)
+            parsed_date = parse_date(date_str)
+            
+            if parsed_date:
+                remaining = line[date_match.end():].strip()
+            
+                amount_matches = list(_AMOUNT_RE.finditer(remaining))
+            
+                if amount_matches:
+                    amounts = [m.group() for m in amount_matches]
+                    last_amount = amounts[-1]
+                    last_pos = amount_matches[-1].start()
                 
-                if parsed_date:
-                    remaining = line[date_match.end():].strip()
-                    
-                    amounts = re.findall(r'[\$]?\s*[\-\(]?\s*[\d,]+\.\d{2}\s*[\)]?', remaining)
+                    description = remaining[:last_pos].strip()
+                
+                    for amt in amounts[:-1]:
+                        pos = description.rfind(amt)
+                        if pos > len(description) * 0.6:
+                            description = description[:pos].strip()
+                
+                    description = _TRAILING_AMOUNT_RE.sub('', description).strip()
+                    description = _LEADING_NUMBER_RE.sub('', description).strip()
+                
+                    amount_val = parse_amount(last_amount)
+                
+                    if description and len(description) > 2 and amount_val is not None:
+                        is_debit = '-' in last_amount or '(' in last_amount
                     
-                    if amounts:
-                        last_amount = amounts[-1]
-                        last_pos = remaining.rfind(last_amount)
-                        
-                        description = remaining[:last_pos].strip()
-                        
-                        for amt in amounts[:-1]:
-                            pos = description.rfind(amt)
-                            if pos > len(description) * 0.6:
-                                description = description[:pos].strip()
-                        
-                        description = re.sub(r'\s+[\d,]+\.\d{2}\s*$', '', description).strip()
-                        description = re.sub(r'^\d+\s+', '', description).strip()
-                        
-                        amount_val = parse_amount(last_amount)
-                        
-                        if description and len(description) > 2 and amount_val is not None:
-                            is_debit = '-' in last_amount or '(' in last_amount
-                            
-                            transactions.append({
-                                'date': parsed_date.strftime('%Y-%m-%d'),
-                                'description': description[:200],
-                                'amount': abs(amount_val),
-                                'debit': abs(amount_val) if is_debit else 0,
-                                'credit': abs(amount_val) if not is_debit else 0,
-                                'balance': None,
-                                'raw_line': line[:300]
-                            })
-                            break
+                        transactions.append({
+                            'date': parsed_date.strftime('%Y-%m-%d'),
+                            'description': description[:200],
+                            'amount': abs(amount_val),
+                            'debit': abs(amount_val) if is_debit else 0,
+                            'credit': abs(amount_val) if not is_debit else 0,
+                            'balance': None,
+                            'raw_line': line[:300]
+                        })
+                        break
     
     return transactions
 
@@ -538,11 +969,11 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
     Other withdrawals (debits), Deposits/credits.
     """
     transactions = []
-    lines = text.split('\n')
+    lines = _candidate_lines(text, _TRUIST_CANDIDATE_RE)
     
     current_year = datetime.now().year
     
-    period_match = re.search(r'(?:as of|For)\s*(\d{2}/\d{2}/\d{4})', text)
+    period_match = _TRUIST_PERIOD_RE.search(text)
     if period_match:
         try:
             d = datetime.strptime(period_match.group(1), '%m/%d/%Y')
@@ -550,7 +981,7 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
         except:
             pass
     
-    end_match = re.search(r'new balance as of\s*(\d{2}/\d{2}/\d{4})', text)
+    end_match = _TRUIST_END_RE.search(text)
     if end_match:
         try:
             d = datetime.strptime(end_match.group(1), '%m/%d/%Y')
@@ -561,14 +992,14 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
     section_type = None
     in_checks = False
     
-    for line in lines:
+    for line, line_upper in lines:
         line_stripped = line.strip()
         if not line_stripped:
             continue
         
-        upper = line_stripped.upper()
+        upper = line_upper.strip()
         
-        if re.match(r'^CHECKS$', upper) or upper.startswith('CHECKS') and 'CHECK#' not in upper and 'CHECKING' not in upper and 'AMOUNT' not in upper:
+        if upper == 'CHECKS' or upper.startswith('CHECKS') and 'CHECK#' not in upper and 'CHECKING' not in upper and 'AMOUNT' not in upper:
             if 'DEDUCTION' not in upper and 'CHARGE' not in upper and 'WITHDRAWAL' not in upper:
                 section_type = 'debit'
                 in_checks = True
@@ -577,7 +1008,9 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
         if 'DATE' in upper and 'CHECK#' in upper and 'AMOUNT' in upper:
             continue
         
-        if 'OTHERWITHDRAWALS' in upper.replace(' ', '') or ('OTHER' in upper and 'WITHDRAWAL' in upper) or ('DEBITS' in upper and 'SERVICE' in upper):
+        compact = upper.replace(' ', '')
+        
+        if 'OTHERWITHDRAWALS' in compact or ('OTHER' in upper and 'WITHDRAWAL' in upper) or ('DEBITS' in upper and 'SERVICE' in upper):
             section_type = 'debit'
             in_checks = False
             continue
@@ -585,12 +1018,12 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
         if upper.startswith('DATE') and 'DESCRIPTION' in upper and 'AMOUNT' in upper:
             continue
         
-        if 'DEPOSITS' in upper.replace(' ', '') and ('CREDIT' in upper.replace(' ', '') or 'INTEREST' in upper.replace(' ', '')):
+        if 'DEPOSITS' in compact and ('CREDIT' in compact or 'INTEREST' in compact):
             section_type = 'credit'
             in_checks = False
             continue
         
-        if 'TOTALCHECKS' in upper.replace(' ', '') or 'TOTALOTHER' in upper.replace(' ', '') or 'TOTALDEPOSITS' in upper.replace(' ', ''):
+        if 'TOTALCHECKS' in compact or 'TOTALOTHER' in compact or 'TOTALDEPOSITS' in compact:
             continue
         
         if upper.startswith('ACCOUNTSUMMARY') or upper.startswith('YOUR PREVIOUS') or upper.startswith('YOUR NEW'):
@@ -599,31 +1032,30 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
         if 'CONTINUED' in upper or upper.startswith('§') or upper.startswith('PAGE') or 'TRUIST DYNAMIC' in upper:
             continue
         
-        if re.match(r'^\d{10,}$', line_stripped) or re.match(r'^\d{3}\d+MAV$', line_stripped.replace(' ', '')):
+        if _TRUIST_ACCOUNT_LINE_RE.match(line_stripped) or _TRUIST_MAV_RE.match(line_stripped.replace(' ', '')):
             continue
         
-        if re.match(r'^(FL|Page)\s', line_stripped) or line_stripped.startswith('¡'):
+        if _TRUIST_FOOTER_RE.match(line_stripped) or line_stripped.startswith('¡'):
             continue
         
         if '*' == line_stripped.strip():
             continue
         
-        if re.match(r'^\*indicates', line_stripped):
+        if line_stripped.startswith('*indicates'):
             continue
         
         if section_type is None:
             continue
         
         if in_checks:
-            check_entries = re.findall(r'(\d{2}/\d{2})\s+(\d+)\s+([\d,]+\.\d{2})', line_stripped)
+            check_entries = _TRUIST_CHECK_ENTRY_RE.findall(line_stripped)
             for entry in check_entries:
                 date_str, check_num, amount_str = entry
                 try:
                     amount = float(amount_str.replace(',', ''))
                 except:
                     continue
-                full_date = f"{date_str}/{current_year}"
-                parsed_date = parse_date(full_date)
+                parsed_date = _parse_mmdd(date_str, current_year)
                 if not parsed_date:
                     continue
                 transactions.append({
@@ -637,7 +1069,7 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
                 })
             continue
         
-        match = re.match(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s*$', line_stripped)
+        match = _TRUIST_LINE_RE.match(line_stripped)
         if match:
             date_str = match.group(1)
             description = match.group(2).strip()
@@ -648,12 +1080,11 @@ def extract_transactions_truist(text: str, tables: List[List] = None) -> List[Di
             except:
                 continue
             
-            full_date = f"{date_str}/{current_year}"
-            parsed_date = parse_date(full_date)
+            parsed_date = _parse_mmdd(date_str, current_year)
             if not parsed_date:
                 continue
             
-            description = re.sub(r'\s+\d+\s*$', '', description).strip()
+            description = _TRAILING_NUMBER_RE.sub('', description).strip()
             
             is_credit = section_type == 'credit'
             is_debit = section_type == 'debit'
@@ -679,11 +1110,11 @@ def extract_transactions_pnc(text: str, tables: List[List] = None) -> List[Dict]
     ATM Transactions, ACH Deductions, Service Charges, Other Deductions.
     """
     transactions = []
-    lines = text.split('\n')
+    lines = _candidate_lines(text, _PNC_CANDIDATE_RE)
     
     current_year = datetime.now().year
     
-    period_match = re.search(r'Period\s+(\d{2}/\d{2}/\d{4})\s+to\s+(\d{2}/\d{2}/\d{4})', text)
+    period_match = _PNC_PERIOD_RE.search(text)
     if period_match:
         try:
             end_date = datetime.strptime(period_match.group(2), '%m/%d/%Y')
@@ -694,39 +1125,12 @@ def extract_transactions_pnc(text: str, tables: List[List] = None) -> List[Dict]
     section_type = None
     in_checks = False
     
-    skip_patterns = [
-        r'^Date\s+Transaction\s+Reference',
-        r'^posted\s+Amount\s+description',
-        r'^Date\s+Check\s+Reference',
-        r'^posted\s+number\s+Amount',
-        r'continued on next page',
-        r'\(cid:\d+\)',
-        r'^Business Checking',
-        r'^For 24-hour',
-        r'^pnc\.com',
-        r'^Primary Account Number',
-        r'^Page \d+ of \d+',
-        r'^Effective \d{2}-\d{2}',
-        r'^\d{3}-\d{7}',
-        r'^[A-Z]{3}\s+\w.{0,40}Mav$',
-        r'^Payoneer\s',
-        r'^ADP\s',
-        r'Gap in check sequence',
-        r'^Detail of Services',
-        r'^Note:',
-        r'^\*\* Combined',
-        r'^Description\s+Volume\s+Amount',
-        r'^Monthly',
-        r'^Total',
-        r'^Member FDIC',
-    ]
-    
-    for line in lines:
+    for line, line_upper in lines:
         line_stripped = line.strip()
         if not line_stripped:
             continue
         
-        upper = line_stripped.upper()
+        upper = line_upper.strip()
         
         if 'DAILY BALANCE' in upper:
             section_type = 'skip'
@@ -782,24 +1186,18 @@ def extract_transactions_pnc(text: str, tables: List[List] = None) -> List[Dict]
         if section_type == 'skip':
             continue
         
-        should_skip = False
-        for pat in skip_patterns:
-            if re.search(pat, line_stripped, re.IGNORECASE):
-                should_skip = True
-                break
-        if should_skip:
+        if _PNC_SKIP_PREFIX_RE.match(line_stripped) or _PNC_SKIP_ANYWHERE_RE.search(line_stripped):
             continue
         
         if in_checks:
-            check_entries = re.findall(r'(\d{2}/\d{2})\s+(\d+\s*\*?\s*)\s+([\d,]+\.\d{2})\s+(\d+)', line_stripped)
+            check_entries = _PNC_CHECK_ENTRY_RE.findall(line_stripped)
             for entry in check_entries:
                 date_str, check_num, amount_str, ref_num = entry
                 try:
                     amount = float(amount_str.replace(',', ''))
                 except:
                     continue
-                full_date = f"{date_str}/{current_year}"
-                parsed_date = parse_date(full_date)
+                parsed_date = _parse_mmdd(date_str, current_year)
                 if not parsed_date:
                     continue
                 chk = check_num.strip().replace('*', '').strip()
@@ -815,7 +1213,7 @@ def extract_transactions_pnc(text: str, tables: List[List] = None) -> List[Dict]
                 })
             continue
         
-        match = re.match(r'^(\d{2}/\d{2})\s+([\d,]+\.\d{2})([-]?)\s+(.+)', line_stripped)
+        match = _PNC_LINE_RE.match(line_stripped)
         if match:
             date_str = match.group(1)
             amount_str = match.group(2)
@@ -827,8 +1225,7 @@ def extract_transactions_pnc(text: str, tables: List[List] = None) -> List[Dict]
             except:
                 continue
             
-            full_date = f"{date_str}/{current_year}"
-            parsed_date = parse_date(full_date)
+            parsed_date = _parse_mmdd(date_str, current_year)
             if not parsed_date:
                 continue
             
@@ -881,12 +1278,12 @@ def _extract_transactions_chase_legacy(text: str, tables: List[List] = None) ->
     in_transaction_section = False
     
     for line in lines:
-        if any(keyword in line.upper() for keyword in ['TRANSACTION DETAIL', 'CHECKING SUMMARY', 'DEPOSITS AND ADDITIONS', 'WITHDRAWALS']):
+        if _CHASE_SECTION_RE.search(line):
             in_transaction_section = True
             continue
         
         if in_transaction_section:
-            date_match = re.match(r'^(\d{2}/\d{2})\s+(.+?)\s+([\-]?[\d,]+\.\d{2})(?:\s+([\d,]+\.\d{2}))?', line)
+            date_match = _CHASE_LINE_RE.match(line)
             if date_match:
                 date_str = date_match.group(1)
                 description = date_match.group(2).strip()
@@ -898,8 +1295,7 @@ def _extract_transactions_chase_legacy(text: str, tables: List[List] = None) ->
                 
                 if amount is not None:
                     current_year = datetime.now().year
-                    full_date = f"{date_str}/{current_year}"
-                    parsed_date = parse_date(full_date)
+                    parsed_date = _parse_mmdd(date_str, current_year)
                     
                     transactions.append({
                         'date': parsed_date.strftime('%Y-%m-%d') if parsed_date else date_str,
@@ -931,25 +1327,14 @@ def extract_account_info(text: str, bank_format: str) -> Dict:
         'bank_name': bank_format.replace('_', ' ').title() if bank_format != 'unknown' else 'Unknown Bank'
     }
     
-    account_patterns = [
-        r'Account\s*(?:Number|#|No\.?)?\s*[:\s]*[\*xX]*(\d{4,})',
-        r'(?:Account|Acct)\s*[:\s]*[\*xX]+(\d{4})',
-        r'ending\s+in\s+(\d{4})',
-    ]
-    
-    for pattern in account_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for regex in _ACCOUNT_NUMBER_REGEXES:
+        match = regex.search(text)
         if match:
             account_info['account_number'] = f"****{match.group(1)[-4:]}"
             break
     
-    period_patterns = [
-        r'(?:Statement\s+Period|Period)[:\s]*(\w+\s+\d{1,2},?\s+\d{4})\s*(?:to|through|-)\s*(\w+\s+\d{1,2},?\s+\d{4})',
-        r'(\d{1,2}/\d{1,2}/\d{2,4})\s*(?:to|through|-)\s*(\d{1,2}/\d{1,2}/\d{2,4})',
-    ]
-    
-    for pattern in period_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for regex in _PERIOD_REGEXES:
+        match = regex.search(text)
         if match:
             start_date = parse_date(match.group(1))
             end_date = parse_date(match.group(2))
@@ -959,45 +1344,43 @@ def extract_account_info(text: str, bank_format: str) -> Dict:
                 account_info['statement_period_end'] = end_date.strftime('%Y-%m-%d')
             break
     
-    balance_patterns = [
-        (r'(?:Beginning|Opening|Previous)\s+Balance[:\s]*\$?([\d,]+\.\d{2})', 'opening_balance'),
-        (r'(?:Ending|Closing|New)\s+Balance[:\s]*\$?([\d,]+\.\d{2})', 'closing_balance'),
-    ]
-    
-    for pattern, key in balance_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for regex, key in _BALANCE_REGEXES:
+        match = regex.search(text)
         if match:
             account_info[key] = parse_amount(match.group(1))
     
     return account_info
 
 
+# bank_format -> bank-specific parser; anything else takes the generic fallback
+_PARSERS: Dict[str, Callable] = {
+    'pnc': extract_transactions_pnc,
+    'truist': extract_transactions_truist,
+    'chase': extract_transactions_chase,
+    'bofa': extract_transactions_bofa,
+    'bank_of_america': extract_transactions_bofa,
+    'wells_fargo': extract_transactions_wells_fargo,
+    'wells': extract_transactions_wells_fargo,
+    'citibank': extract_transactions_citibank,
+    'citi': extract_transactions_citibank,
+    'us_bank': extract_transactions_us_bank,
+    'webster': extract_transactions_webster,
+}
+
+
 def parse_transactions(text: str, bank_format: str, tables: List[List] = None) -> List[Dict]:
     """
     Parse transaction data from extracted text based on bank format.
     Routes to bank-specific parsers or improved generic fallback.
     """
-    if bank_format == 'pnc':
-        return extract_transactions_pnc(text, tables)
-    elif bank_format == 'truist':
-        return extract_transactions_truist(text, tables)
-    elif bank_format == 'chase':
-        return extract_transactions_chase(text, tables)
-    elif bank_format in ['bofa', 'bank_of_america']:
-        return extract_transactions_bofa(text, tables)
-    elif bank_format in ['wells_fargo', 'wells']:
-        return extract_transactions_wells_fargo(text, tables)
-    elif bank_format in ['citibank', 'citi']:
-        return extract_transactions_citibank(text, tables)
-    elif bank_format == 'us_bank':
-        return extract_transactions_us_bank(text, tables)
-    elif bank_format == 'webster':
-        return extract_transactions_webster(text, tables)
-    else:
-        transactions = extract_transactions_generic_improved(text, tables)
-        if not transactions:
-            transactions = extract_transactions_generic(text, tables)
-        return transactions
+    parser = _PARSERS.get(bank_format)
+    if parser:
+        return parser(text, tables)
+
+    transactions = extract_transactions_generic_improved(text, tables)
+    if not transactions:
+        transactions = extract_transactions_generic(text, tables)
+    return transactions
 
 
 def calculate_summary_stats(transactions: List[Dict]) -> Dict:
@@ -1015,16 +1398,18 @@ def calculate_summary_stats(transactions: List[Dict]) -> Dict:
     
     deposits = [t['credit'] for t in transactions if t.get('credit', 0) > 0]
     withdrawals = [t['debit'] for t in transactions if t.get('debit', 0) > 0]
+    total_deposits = sum(deposits)
+    total_withdrawals = sum(withdrawals)
     
     return {
-        'total_deposits': sum(deposits),
-        'total_withdrawals': sum(withdrawals),
+        'total_deposits': total_deposits,
+        'total_withdrawals': total_withdrawals,
         'deposit_count': len(deposits),
         'withdrawal_count': len(withdrawals),
         'transaction_count': len(transactions),
-        'average_deposit': sum(deposits) / len(deposits) if deposits else 0,
-        'average_withdrawal': sum(withdrawals) / len(withdrawals) if withdrawals else 0,
-        'net_cash_flow': sum(deposits) - sum(withdrawals),
+        'average_deposit': total_deposits / len(deposits) if deposits else 0,
+        'average_withdrawal': total_withdrawals / len(withdrawals) if withdrawals else 0,
+        'net_cash_flow': total_deposits - total_withdrawals,
     }
 
 
@@ -1043,43 +1428,152 @@ def _normalize_transactions(transactions: List[Dict]) -> List[Dict]:
     return transactions
 
 
-def process_bank_statement(pdf_path: str) -> Dict:
+def _statement_digest(pdf_path: str) -> str:
+    """Return the blake2b digest of the PDF's bytes, hashing only when it changed."""
+    st = os.stat(pdf_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.path.abspath(pdf_path)
+    cached = _DIGEST_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    h = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    digest = h.hexdigest()
+    _DIGEST_CACHE[key] = (stamp, digest)
+    return digest
+
+
+def _statement_cache_path(digest: str) -> str:
+    return os.path.join(_STATEMENT_CACHE_DIR, f"v{_STATEMENT_CACHE_VERSION}-{digest}.json")
+
+
+def _load_cached_statement(cache_path: str) -> Optional[Dict]:
+    try:
+        if os.path.getmtime(cache_path) < time.time() - _STATEMENT_CACHE_MAX_AGE_DAYS * 86400:
+            return None
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_statement(cache_path: str, result: Dict) -> None:
+    """Write result atomically; a failed write only costs the cache entry."""
+    purge_statement_cache()
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_STATEMENT_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(result, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def purge_statement_cache(max_age_days: float = _STATEMENT_CACHE_MAX_AGE_DAYS) -> int:
+    """
+    Delete cached statements written more than max_age_days ago, along with
+    entries from an older _STATEMENT_CACHE_VERSION. Pass max_age_days=0 to
+    empty the cache. Returns the number of files removed.
+    """
+    try:
+        names = os.listdir(_STATEMENT_CACHE_DIR)
+    except OSError:
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    current = f"v{_STATEMENT_CACHE_VERSION}-"
+    removed = 0
+    for name in names:
+        path = os.path.join(_STATEMENT_CACHE_DIR, name)
+        try:
+            if name.startswith(current) and os.path.getmtime(path) > cutoff:
+                continue
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def process_bank_statement(pdf_path: str, use_cache: bool = True, parallel: bool = True) -> Dict:
     """
     Main function to process a complete bank statement.
     Returns complete parsed data including account info and transactions.
-    """
-    warnings = []
-    errors = []
-    fraud_flags = []
-    extraction_method = "pdfplumber"
 
+    Successful results are cached on disk by the PDF's content hash, so
+    re-processing an identical file skips extraction and parsing. Entries
+    expire after _STATEMENT_CACHE_MAX_AGE_DAYS and are purged whenever a new
+    one is written. Pass use_cache=False to always parse.
+
+    parallel=False keeps page extraction and OCR in this process, one page
+    at a time; process_bank_statements() uses it inside its own workers.
+    """
     if not os.path.exists(pdf_path):
         return {
             'error': f'File not found: {pdf_path}',
             'success': False
         }
 
+    cache_path = None
+    if use_cache:
+        try:
+            cache_path = _statement_cache_path(_statement_digest(pdf_path))
+        except OSError:
+            cache_path = None
+    if cache_path:
+        cached = _load_cached_statement(cache_path)
+        if cached is not None:
+            # The same bytes may arrive under a different name
+            cached['filename'] = os.path.basename(pdf_path)
+            return cached
+
+    result = _process_bank_statement(pdf_path, parallel)
+    if cache_path and result.get('success'):
+        _save_cached_statement(cache_path, result)
+    return result
+
+
+def process_bank_statements(pdf_paths: List[str], use_cache: bool = True) -> List[Dict]:
+    """
+    Run process_bank_statement() on several PDFs, returning results in input
+    order. Statements are processed concurrently in worker processes; text
+    extraction and parsing are pure Python under the GIL, so threads would
+    not overlap them. Each worker handles its statement serially, so the
+    per-statement page and OCR pools do not multiply the worker count.
+    """
+    workers = min(os.cpu_count() or 1, len(pdf_paths))
+    if workers < 2:
+        return [process_bank_statement(pdf_path, use_cache) for pdf_path in pdf_paths]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        return list(pool.map(process_bank_statement, pdf_paths, repeat(use_cache), repeat(False)))
+
+
+def _process_bank_statement(pdf_path: str, parallel: bool = True) -> Dict:
+    """Run the full extraction and parsing pipeline for process_bank_statement()."""
+    warnings = []
+    errors = []
+    fraud_flags = []
+    extraction_method = "pdfplumber"
+
     raw_text = ""
     tables = []
+    page_count = 0
 
     try:
         with pdfplumber.open(pdf_path) as pdf:
             fraud_flags = check_pdf_metadata(pdf)
+            page_count = len(pdf.pages)
 
             text_parts = []
-            for page in pdf.pages:
-                text = page.extract_text()
+            for text, page_tables in _iter_page_content(pdf, pdf_path, parallel=parallel):
                 if text:
                     text_parts.append(text)
-
-                page_tables = page.extract_tables()
-                for table in page_tables:
-                    if table:
-                        tables.extend([row for row in table if row])
-                        for row in table:
-                            if row:
-                                row_text = ' | '.join([str(cell) if cell else '' for cell in row])
-                                text_parts.append(row_text)
+                _collect_table_rows(page_tables, tables, text_parts)
 
             raw_text = '\n'.join(text_parts)
     except Exception as e:
@@ -1087,7 +1581,7 @@ def process_bank_statement(pdf_path: str) -> Dict:
 
     if not raw_text or len(raw_text.strip()) < 100:
         warnings.append("pdfplumber found no text, falling back to OCR")
-        ocr_text = extract_text_ocr(pdf_path)
+        ocr_text = extract_text_ocr(pdf_path, parallel=parallel)
         if ocr_text and len(ocr_text.strip()) > 100:
             raw_text = ocr_text
             extraction_method = "pytesseract_ocr"
@@ -1136,7 +1630,7 @@ def process_bank_statement(pdf_path: str) -> Dict:
         'transactions': transactions,
         'summary': summary_stats,
         'raw_text_length': len(raw_text),
-        'page_count': raw_text.count('\f') + 1 if '\f' in raw_text else 1,
+        'page_count': page_count or (raw_text.count('\f') + 1 if '\f' in raw_text else 1),
         'fraud_flags': fraud_flags,
         'address_extracted': address_extracted,
         'extraction_method': extraction_method,
@@ -5,10 +5,18 @@ and estimates funding amounts, remaining balances, and payoff dates.
 """
 
 import re
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 def detect_positions(transactions: list, keywords: dict, factor_rates: dict) -> dict:
     """
@@ -18,8 +26,12 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
     deposits = [t for t in transactions if t.get("amount", 0) > 0]
 
     recurring_groups = _find_recurring_debits(withdrawals)
+    deposit_dates, dated_deposits = _index_deposits(deposits)
 
     all_lender_kws = _build_lender_lookup(keywords)
+    # Longest alias first, so the most specific one names the lender
+    sorted_aliases = tuple(sorted(all_lender_kws.items(), key=lambda x: -len(x[0])))
+    alias_automaton = _build_alias_automaton(sorted_aliases)
     generic_kws = [kw.upper() for kw in keywords.get("generic_mca_keywords", [])]
     default_rate = factor_rates.get("default_rate", 1.35)
     lender_rates = factor_rates.get("lender_rates", {})
@@ -31,19 +43,20 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
         payment_amount = abs(group["amount"])
         sample_descs = [t.get("description", "") for t in group["transactions"][:3]]
 
+        desc_uppers = [t.get("description", "").upper() for t in group["transactions"]]
+
         lender_name = None
         confidence = "LOW"
 
-        for desc in [t.get("description", "") for t in group["transactions"]]:
-            name = _match_lender_name(desc, all_lender_kws)
+        for desc_upper in desc_uppers:
+            name = _match_lender_name(desc_upper, sorted_aliases, alias_automaton)
             if name:
                 lender_name = name
                 confidence = "HIGH"
                 break
 
         if not lender_name:
-            for desc in [t.get("description", "") for t in group["transactions"]]:
-                desc_upper = desc.upper()
+            for desc_upper in desc_uppers:
                 for kw in generic_kws:
                     if kw in desc_upper:
                         lender_name = f"Unknown MCA ({kw})"
@@ -61,14 +74,15 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
 
         position_num += 1
         freq = group["frequency"]
-        dates = sorted([t.get("date", "") for t in group["transactions"]])
-        first_date = dates[0] if dates else ""
-        last_date = dates[-1] if dates else ""
+        # _find_recurring_debits hands back each group's transactions date-sorted
+        group_txns = group["transactions"]
+        first_date = group_txns[0].get("date", "") if group_txns else ""
+        last_date = group_txns[-1].get("date", "") if group_txns else ""
 
         rate = lender_rates.get(lender_name, default_rate) if lender_name in lender_rates else default_rate
 
         funding_dep = _find_funding_deposit(
-            deposits, first_date, lender_name, all_lender_kws, payment_amount
+            deposit_dates, dated_deposits, first_date, lender_name, all_lender_kws, payment_amount
         )
 
         has_known_funding = bool(funding_dep)
@@ -111,7 +125,7 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
             remaining_cal_days = remaining_payments * 30
 
         try:
-            last_dt = datetime.strptime(last_date, "%Y-%m-%d")
+            last_dt = _parse_date(last_date)
             payoff_dt = last_dt + timedelta(days=int(remaining_cal_days))
             est_payoff = payoff_dt.strftime("%Y-%m-%d")
         except (ValueError, TypeError):
@@ -141,6 +155,8 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
 
     total_daily = 0.0
     total_monthly = 0.0
+    days_since_last = 999
+    now = datetime.now()
     for p in positions:
         if p["payment_frequency"] == "daily":
             total_daily += p["payment_amount"]
@@ -152,13 +168,11 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
             total_monthly += p["payment_amount"]
             total_daily += p["payment_amount"] / 21.5
 
-    days_since_last = 999
-    for p in positions:
         fd = p.get("funding_deposit_date") or p.get("first_payment_date")
         if fd:
             try:
-                fdt = datetime.strptime(fd, "%Y-%m-%d")
-                delta = (datetime.now() - fdt).days
+                fdt = _parse_date(fd)
+                delta = (now - fdt).days
                 days_since_last = min(days_since_last, delta)
             except ValueError:
                 pass
@@ -181,6 +195,24 @@ def detect_positions(transactions: list, keywords: dict, factor_rates: dict) ->
 
 # ── Private helpers ───────────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD transaction date. Cached: a statement has a few hundred
+    distinct dates, and each one is parsed by the frequency check, the funding
+    search and the payoff estimate. Raises ValueError like strptime.
+
+    Canonical zero-padded dates are sliced straight into datetime(); anything
+    else (unpadded fields, stray text) goes through strptime so the accepted
+    inputs don't change.
+    """
+    if (isinstance(date_str, str) and len(date_str) == 10 and date_str.isascii()
+            and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[:4].isdecimal() and date_str[5:7].isdecimal() and date_str[8:].isdecimal()):
+        return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
 def _find_recurring_debits(withdrawals: list) -> list:
     """
     Cluster withdrawals by similar amount (within $1 tolerance).
@@ -195,19 +227,19 @@ def _find_recurring_debits(withdrawals: list) -> list:
         rounded = round(amt, 0)
         amount_groups[rounded].append(txn)
 
+    # Sweep the sorted keys, folding each into the run of keys within $1
+    # above it; the next run starts at the first key past that.
     merged_groups = {}
     sorted_keys = sorted(amount_groups.keys())
-    used = set()
 
-    for key in sorted_keys:
-        if key in used:
-            continue
+    i = 0
+    while i < len(sorted_keys):
+        key = sorted_keys[i]
         group_txns = list(amount_groups[key])
-        for other_key in sorted_keys:
-            if other_key != key and other_key not in used and abs(other_key - key) <= 1:
-                group_txns.extend(amount_groups[other_key])
-                used.add(other_key)
-        used.add(key)
+        i += 1
+        while i < len(sorted_keys) and sorted_keys[i] - key <= 1:
+            group_txns.extend(amount_groups[sorted_keys[i]])
+            i += 1
         if len(group_txns) >= 4:
             avg_amt = sum(abs(t.get("amount", 0)) for t in group_txns) / len(group_txns)
             merged_groups[round(avg_amt, 2)] = group_txns
@@ -233,7 +265,7 @@ def _detect_frequency(txns: list) -> Optional[str]:
     for t in txns:
         d = t.get("date", "")
         try:
-            dates.append(datetime.strptime(d, "%Y-%m-%d"))
+            dates.append(_parse_date(d))
         except ValueError:
             continue
 
@@ -241,13 +273,19 @@ def _detect_frequency(txns: list) -> Optional[str]:
         return None
 
     dates.sort()
-    gaps = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
-    gaps = [g for g in gaps if g > 0]
-
-    if not gaps:
+    # Mean of the positive day gaps (same-day repeats don't count)
+    gap_total = 0
+    gap_count = 0
+    for prev, cur in zip(dates, dates[1:]):
+        gap = (cur - prev).days
+        if gap > 0:
+            gap_total += gap
+            gap_count += 1
+
+    if not gap_count:
         return None
 
-    avg_gap = sum(gaps) / len(gaps)
+    avg_gap = gap_total / gap_count
 
     if avg_gap <= 4:
         return "daily"
@@ -276,17 +314,58 @@ def _build_lender_lookup(keywords: dict) -> dict:
     return lookup
 
 
-def _match_lender_name(description: str, lender_lookup: dict) -> Optional[str]:
-    """Match a transaction description against the lender keyword lookup."""
-    desc_upper = description.upper()
-    for alias, name in sorted(lender_lookup.items(), key=lambda x: -len(x[0])):
+@lru_cache(maxsize=8)
+def _build_alias_automaton(sorted_aliases: tuple):
+    """
+    Aho-Corasick automaton mapping each alias to (rank, name), rank being its
+    position in sorted_aliases. None without pyahocorasick, or when an alias
+    is empty (it matches everywhere, which the automaton can't express).
+    Cached: the keyword config rarely changes between calls.
+    """
+    if not AHOCORASICK_AVAILABLE or not sorted_aliases or not all(alias for alias, _ in sorted_aliases):
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, (alias, name) in enumerate(sorted_aliases):
+        automaton.add_word(alias, (rank, name))
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_lender_name(desc_upper: str, sorted_aliases: tuple, automaton=None) -> Optional[str]:
+    """
+    Match an upper-cased transaction description against the lender lookup's
+    (alias, name) pairs, sorted longest alias first; the first alias found
+    names the lender. With an automaton from _build_alias_automaton(), one
+    pass over the description finds every alias in it and the lowest rank wins.
+    """
+    if automaton is not None:
+        best = min((value for _, value in automaton.iter(desc_upper)), default=None)
+        return best[1] if best else None
+    for alias, name in sorted_aliases:
         if alias in desc_upper:
             return name
     return None
 
 
+def _index_deposits(deposits: list) -> Tuple[list, list]:
+    """
+    Sort deposits by parsed date for the funding-window search. Returns the
+    sorted dates and a parallel list of (statement_position, deposit) pairs;
+    deposits without a parseable date can never fall in a window and are left out.
+    """
+    dated = []
+    for pos, dep in enumerate(deposits):
+        try:
+            dated.append((_parse_date(dep.get("date", "")), pos, dep))
+        except (ValueError, TypeError):
+            continue
+    dated.sort(key=lambda x: (x[0], x[1]))
+    return [x[0] for x in dated], [(x[1], x[2]) for x in dated]
+
+
 def _find_funding_deposit(
-    deposits: list,
+    deposit_dates: list,
+    dated_deposits: list,
     first_payment_date: str,
     lender_name: str,
     lender_lookup: dict,
@@ -294,13 +373,14 @@ def _find_funding_deposit(
 ) -> Optional[dict]:
     """
     Look for a large deposit ($5K+) 1-7 days before the first payment date
-    that might be the original MCA funding.
+    that might be the original MCA funding. deposit_dates / dated_deposits
+    come from _index_deposits(); the window is bisected out of them.
     """
     if not first_payment_date:
         return None
 
     try:
-        first_dt = datetime.strptime(first_payment_date, "%Y-%m-%d")
+        first_dt = _parse_date(first_payment_date)
     except ValueError:
         return None
 
@@ -309,31 +389,30 @@ def _find_funding_deposit(
 
     min_funding = max(5000, payment_amount * 10)
 
+    lo = bisect_left(deposit_dates, window_start)
+    hi = bisect_right(deposit_dates, window_end)
+    # Back to statement order, so ties on amount resolve as they always have
+    in_window = sorted(dated_deposits[lo:hi], key=lambda x: x[0])
+
     candidates = []
-    for dep in deposits:
+    for _, dep in in_window:
         amt = dep.get("amount", 0)
         if amt < min_funding:
             continue
-        d = dep.get("date", "")
-        try:
-            dep_dt = datetime.strptime(d, "%Y-%m-%d")
-        except ValueError:
-            continue
-        if window_start <= dep_dt <= window_end:
-            desc_upper = dep.get("description", "").upper()
-            from_lender = False
-            if lender_name and not lender_name.startswith("Unknown"):
-                for alias, name in lender_lookup.items():
-                    if name == lender_name and alias in desc_upper:
-                        from_lender = True
-                        break
+        desc_upper = dep.get("description", "").upper()
+        from_lender = False
+        if lender_name and not lender_name.startswith("Unknown"):
+            for alias, name in lender_lookup.items():
+                if name == lender_name and alias in desc_upper:
+                    from_lender = True
+                    break
 
-            candidates.append({
-                "date": d,
-                "amount": amt,
-                "description": dep.get("description", ""),
-                "from_lender": from_lender,
-            })
+        candidates.append({
+            "date": dep.get("date", ""),
+            "amount": amt,
+            "description": dep.get("description", ""),
+            "from_lender": from_lender,
+        })
 
     if not candidates:
         return None
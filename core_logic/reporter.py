@@ -6,6 +6,7 @@ Generates Master Excel reports with multiple tabs using XlsxWriter.
 import xlsxwriter
 import json
 import pandas as pd
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime
 import os
@@ -14,8 +15,11 @@ import os
 def create_workbook(output_path: str) -> xlsxwriter.Workbook:
     """
     Create a new Excel workbook for the report.
+    Rows are flushed to disk as soon as a later row is written
+    (constant_memory), so a long Transactions sheet isn't held in memory.
+    Every sheet must therefore be written top to bottom.
     """
-    workbook = xlsxwriter.Workbook(output_path)
+    workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
     return workbook
 
 
@@ -250,6 +254,17 @@ def add_transactions_sheet(workbook: xlsxwriter.Workbook, transactions: List[Dic
             sheet.write(row, 6, balance, formats['currency'])
 
 
+@lru_cache(maxsize=4096)
+def _month_key(date_str: str) -> str:
+    """YYYY-MM bucket for a transaction date. Cached: a statement repeats the same few hundred dates."""
+    try:
+        dt = datetime.strptime(date_str, '%Y-%m-%d')
+        return dt.strftime('%Y-%m')
+    except (ValueError, TypeError):
+        parts = date_str.split('-')
+        return f"{parts[0]}-{parts[1]}" if len(parts) >= 2 else date_str
+
+
 def add_monthly_analysis_sheet(workbook: xlsxwriter.Workbook, monthly_data: pd.DataFrame, formats: Dict, per_bank_transactions: Optional[Dict] = None) -> None:
     """
     Add monthly breakdown analysis sheet.
@@ -274,12 +289,7 @@ def add_monthly_analysis_sheet(workbook: xlsxwriter.Workbook, monthly_data: pd.D
                 date_str = txn.get('date', '')
                 if not date_str:
                     continue
-                try:
-                    dt = datetime.strptime(str(date_str), '%Y-%m-%d')
-                    month_key = dt.strftime('%Y-%m')
-                except (ValueError, TypeError):
-                    parts = str(date_str).split('-')
-                    month_key = f"{parts[0]}-{parts[1]}" if len(parts) >= 2 else str(date_str)
+                month_key = _month_key(str(date_str))
 
                 if month_key not in bank_monthly:
                     bank_monthly[month_key] = {'deposits': 0, 'withdrawals': 0}
@@ -353,7 +363,7 @@ def add_monthly_analysis_sheet(workbook: xlsxwriter.Workbook, monthly_data: pd.D
 
     data_start_row = row
     if monthly_data is not None and not monthly_data.empty:
-        for _, data in monthly_data.iterrows():
+        for data in monthly_data.to_dict('records'):
             sheet.write(row, 0, str(data.get('month', '')), formats['text'])
             sheet.write(row, 1, data.get('deposits', 0), formats['currency'])
             sheet.write(row, 2, data.get('withdrawals', 0), formats['currency'])
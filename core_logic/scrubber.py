@@ -207,22 +207,38 @@ def rename_descriptions(transactions: List[Dict], mapping: Dict[str, str] = None
     return result
 
 
-def calculate_daily_balances(transactions: List[Dict], opening_balance: float = 0) -> pd.DataFrame:
+def _dated_frame(transactions: List[Dict]) -> Optional[pd.DataFrame]:
     """
-    Calculate daily ending balances from transactions.
+    Build the columnar view of transactions shared by the daily and monthly
+    breakdowns: dates parsed once, undated rows dropped. None when no row
+    has a usable date.
     """
     if not transactions:
-        return pd.DataFrame(columns=['date', 'ending_balance', 'daily_deposits', 'daily_withdrawals'])
+        return None
     
     df = pd.DataFrame(transactions)
     
     if 'date' not in df.columns:
-        return pd.DataFrame(columns=['date', 'ending_balance', 'daily_deposits', 'daily_withdrawals'])
+        return None
     
     df['date'] = pd.to_datetime(df['date'], errors='coerce')
     df = df.dropna(subset=['date'])
     
     if df.empty:
+        return None
+    return df
+
+
+def calculate_daily_balances(transactions: List[Dict], opening_balance: float = 0) -> pd.DataFrame:
+    """
+    Calculate daily ending balances from transactions.
+    """
+    return _daily_balances(_dated_frame(transactions), opening_balance)
+
+
+def _daily_balances(df: Optional[pd.DataFrame], opening_balance: float = 0) -> pd.DataFrame:
+    """calculate_daily_balances() over a frame from _dated_frame()."""
+    if df is None:
         return pd.DataFrame(columns=['date', 'ending_balance', 'daily_deposits', 'daily_withdrawals'])
     
     daily = df.groupby('date').agg({
@@ -284,23 +300,15 @@ def calculate_monthly_breakdown(transactions: List[Dict]) -> pd.DataFrame:
     """
     Break down transactions by month for trending analysis.
     """
-    if not transactions:
-        return pd.DataFrame()
-    
-    df = pd.DataFrame(transactions)
-    
-    if 'date' not in df.columns:
-        return pd.DataFrame()
-    
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
-    df = df.dropna(subset=['date'])
-    
-    if df.empty:
+    return _monthly_breakdown(_dated_frame(transactions))
+
+
+def _monthly_breakdown(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """calculate_monthly_breakdown() over a frame from _dated_frame(); df is not modified."""
+    if df is None:
         return pd.DataFrame()
     
-    df['month'] = df['date'].dt.to_period('M')
-    
-    monthly = df.groupby('month').agg({
+    monthly = df.groupby(df['date'].dt.to_period('M')).agg({
         'credit': 'sum',
         'debit': 'sum',
     }).reset_index()
@@ -698,9 +706,13 @@ def scrub_transactions(transactions: List[Dict], keywords: Optional[Dict] = None
     
     revenue_metrics = calculate_net_revenue(transactions, exclude_transfers=True)
     
-    monthly_data = calculate_monthly_breakdown(categorized)
+    # One DataFrame feeds both breakdowns instead of each rebuilding it
+    # from the list of dicts and re-parsing every date.
+    dated = _dated_frame(categorized)
+    
+    monthly_data = _monthly_breakdown(dated)
     
-    daily_balances = calculate_daily_balances(categorized)
+    daily_balances = _daily_balances(dated)
     
     concentration = analyze_deposit_concentration(categorized)
     